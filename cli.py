@@ -12,11 +12,33 @@ class CliOptions:
             raise Exception(f"Unknown log level: {value}")
         self.global_log_level = value
 
+    def _parse_bool(self, value: str) -> bool:
+        if value.lower() not in ["true", "false", "1", "0"]:
+            raise Exception(f"Expected true or false: {value}")
+        return value.lower() in ["true", "1"]
+
+    def _set_idle_redraw(self, value: str):
+        self.idle_redraw = self._parse_bool(value)
+
+    def _set_headless(self, value: str):
+        self.headless = self._parse_bool(value)
+
+    def _set_replay_paced(self, value: str):
+        self.replay_paced = self._parse_bool(value)
+
     def __init__(self, args: list[str]):
         self.log_level = "WARNING"
         self.engine_log_level = "WARNING"
         self.global_log_level = "WARNING"
         self.metrics = False
+        self.headless = False
+        self.headless_frames = 0
+        self.fps_cap = 120
+        self.idle_redraw = False
+        self.idle_poll = 0.0
+        self.record = ""
+        self.replay = ""
+        self.replay_paced = False
         self.width = 800
         self.height = 600
 
@@ -42,6 +64,11 @@ class CliOptions:
                 self._print_help()
                 sys.exit(1)
 
+        if self.headless and self.headless_frames <= 0 and not self.replay:
+            print("--headless=true needs --headless-frames= or --replay=")
+            self._print_help()
+            sys.exit(1)
+
     def _cli_arg_name(self, name: str) -> str:
         return f"--{name.replace('_', '-')}"
 
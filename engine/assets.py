@@ -5,6 +5,8 @@ from enum import StrEnum
 from threading import Thread
 from PIL import Image, ImageTk
 
+from engine.headless import HeadlessImage
+
 
 class AssetType(StrEnum):
     Still = "still"
@@ -28,8 +30,9 @@ class Asset:
 
 
 class AssetManager:
-    def __init__(self, asset_folder: str):
+    def __init__(self, asset_folder: str, headless: bool = False):
         self.asset_folder = asset_folder
+        self.headless = headless
         self.raw_assets: dict[str, Asset] = dict()
         self.assets: dict[tuple[str, int, int], ImageTk.PhotoImage] = dict()
         self.animated_assets: dict[
@@ -83,7 +86,7 @@ class AssetManager:
         )
         image = Image.open(os.path.join(self.asset_folder, asset.path))
         image = image.resize((width, height), resample=asset.resampling)
-        tk_image = ImageTk.PhotoImage(image, width=width, height=height)
+        tk_image = self.__to_tk_image(image, width, height)
         self.assets[(key, width, height)] = tk_image
 
     def __load_animated_tileset(self, key: str, asset: Asset, width: int, height: int):
@@ -119,11 +122,16 @@ class AssetManager:
                 )
             )
             tile = tile.resize((width, height), resample=asset.resampling)
-            tk_image = ImageTk.PhotoImage(tile, width=width, height=height)
+            tk_image = self.__to_tk_image(tile, width, height)
             tk_images.append(tk_image)
 
         self.animated_assets[(key, width, height)] = tk_images
 
+    def __to_tk_image(self, image: Image.Image, width: int, height: int):
+        if self.headless:
+            return HeadlessImage(width, height)
+        return ImageTk.PhotoImage(image, width=width, height=height)
+
     def get_raw(self, key: str) -> Asset | None:
         return self.raw_assets.get(key, None)
 
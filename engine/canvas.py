@@ -0,0 +1,486 @@
+from itertools import count
+from tkinter import Canvas, Event
+from typing import Any, Callable, Iterable
+from timeit import default_timer as timer
+
+from engine.metrics import metrics
+from engine.pool import ItemPool, item_defaults
+from engine.recording import recorder
+from engine.stacking import StackingOrder
+
+type Command = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+tcl_commands = {"tag_raise": "raise", "tag_lower": "lower"}
+funcids = count(1)
+parked_offset = -1_000_000
+
+
+def tcl_word(value: Any) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    text = str(value)
+    if text == "":
+        return '""'
+    for char in '\\"$[]':
+        text = text.replace(char, "\\" + char)
+    text = text.replace("\n", "\\n").replace("\t", "\\t").replace("\r", "\\r")
+    return f'"{text}"'
+
+
+class RetainedCanvas:
+    """
+    Wraps a canvas (Tk or headless) and remembers the coords and options last
+    sent for each item, so that repeating the same values costs no Tcl call.
+    Between begin_frame() and flush() the remaining updates are buffered and
+    submitted as a single Tcl script. Raising items by id only records the
+    paint order, the restacking needed is worked out once in flush().
+    Event bindings go through the recorder and are kept in a registry so that
+    a replay can dispatch recorded events to the same handlers.
+    Everything else is passed through to the wrapped canvas.
+
+    Items created between begin_create() and end_create() get the group tags
+    passed to it. A group is placed with place_group(): moving its origin is
+    a single move of the tag, and the coords of its items are remembered
+    relative to it, so items that moved along with the group are not sent
+    again. Deleting a group tag deletes all of its items in one call.
+
+    Deleted items are hidden, stripped of their tags and kept in an item
+    pool; creating an item of the same type takes one from it. Tk only sees
+    one handler per tag and sequence, which runs the handlers registered for
+    it, so reused items keep their Tk bindings and only the registry changes.
+    """
+
+    def __init__(self, canvas: Canvas, pool_size: int = 512):
+        self.canvas = canvas
+        self.sent_coords: dict[int, tuple[float, ...]] = {}
+        self.sent_options: dict[int, dict[str, Any]] = {}
+        self.buffering = False
+        self.buffer: list[Command] = []
+        self.handlers: dict[tuple[str, str, str], dict[str, Callable]] = {}
+        self.stacking = StackingOrder()
+        self.creating: list[tuple[str, ...]] = []
+        self.item_groups: dict[int, tuple[str, ...]] = {}
+        self.group_items: dict[str, set[int]] = {}
+        self.placed: dict[str, tuple[float, float, float, float]] = {}
+        self.moved: dict[str, tuple[float, float]] = {}
+        self.dropped: set[int] = set()
+        self.pool = ItemPool(pool_size)
+        self.item_types: dict[int, str] = {}
+        self.bound: dict[str, dict[str, str]] = {}
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.canvas, name)
+        if not callable(attr):
+            return attr
+
+        def passthrough(*args: Any, **kw: Any):
+            groups = ()
+            if name.startswith("create_") and len(self.creating) > 0:
+                groups = self.creating[-1]
+                if len(groups) > 0:
+                    tags = kw.get("tags", ())
+                    tags = (tags,) if isinstance(tags, str) else tuple(tags)
+                    kw["tags"] = (*tags, *groups)
+
+            type = name[7:] if name.startswith("create_") else None
+            result = None if type is None else self.pool.take(type)
+            if type is not None and result is not None:
+                self.reuse(result, type, args, kw)
+            else:
+                self.flush_buffer()
+                start = timer()
+                result = attr(*args, **kw)
+                metrics.canvas_time += timer() - start
+            if type is not None:
+                self.item_types[result] = type
+                self.stacking.created(result)
+                if len(groups) > 0:
+                    self.item_groups[result] = groups
+                    for group in groups:
+                        self.group_items.setdefault(group, set()).add(result)
+            return result
+
+        return passthrough
+
+    def begin_frame(self):
+        self.buffering = True
+
+    def flush(self):
+        requests = self.stacking.requests
+        ops = self.stacking.resolve()
+        metrics.canvas_calls_skipped += max(requests - len(ops), 0)
+        for name, args in ops:
+            self.submit(name, args)
+
+        self.flush_buffer()
+        self.buffering = False
+
+    def flush_buffer(self):
+        if len(self.buffer) == 0:
+            return
+
+        commands = self.buffer
+        self.buffer = []
+        metrics.tcl_evaluations += 1
+        start = timer()
+
+        eval_batch = getattr(self.canvas, "eval_batch", None)
+        if eval_batch is not None:
+            eval_batch(commands)
+            metrics.canvas_time += timer() - start
+            return
+
+        path = str(self.canvas)
+        lines = []
+        for name, args, options in commands:
+            words = [path, tcl_commands.get(name, name), *map(tcl_word, args)]
+            for option, value in options.items():
+                if value is not None:
+                    words.append(f"-{option}")
+                    words.append(tcl_word(value))
+            lines.append(" ".join(words))
+        self.canvas.tk.eval("\n".join(lines))
+        metrics.canvas_time += timer() - start
+
+    def submit(self, name: str, args: tuple[Any, ...], options: dict[str, Any] = {}):
+        metrics.canvas_calls_issued += 1
+        if self.buffering:
+            self.buffer.append((name, args, options))
+            return
+
+        start = timer()
+        getattr(self.canvas, name)(*args, **options)
+        metrics.canvas_time += timer() - start
+
+    def coords(self, tag_or_id: int | str, *args: Any):
+        if len(args) == 0:
+            self.flush_buffer()
+            start = timer()
+            result = self.canvas.coords(tag_or_id)
+            metrics.canvas_time += timer() - start
+            return result
+
+        coords = tuple(args[0]) if len(args) == 1 else args
+        if not isinstance(tag_or_id, int):
+            self.forget_tag(tag_or_id)
+            self.submit("coords", (tag_or_id, *coords))
+            return
+
+        sent = self.sent_coords.get(tag_or_id)
+        groups = self.item_groups.get(tag_or_id)
+        ox, oy = (0, 0) if groups is None else self.offset(groups)
+        if ox == 0 and oy == 0:
+            local = coords
+            if sent == local:
+                metrics.canvas_calls_skipped += 1
+                return
+        else:
+            # Coords relative to moved groups only match up to rounding.
+            local = tuple(c - (oy if i % 2 else ox) for i, c in enumerate(coords))
+            if sent is not None and all(
+                abs(a - b) < 1e-6 for a, b in zip(sent, local, strict=True)
+            ):
+                metrics.canvas_calls_skipped += 1
+                return
+
+        self.sent_coords[tag_or_id] = local
+        self.submit("coords", (tag_or_id, *coords))
+
+    def itemconfigure(self, tag_or_id: int | str, **options: Any):
+        if not isinstance(tag_or_id, int):
+            self.forget_tag(tag_or_id)
+            self.submit("itemconfigure", (tag_or_id,), options)
+            return
+
+        sent = self.sent_options.setdefault(tag_or_id, {})
+        changed = {}
+        for name, value in options.items():
+            if name not in sent or sent[name] != value:
+                changed[name] = value
+
+        if len(changed) == 0:
+            metrics.canvas_calls_skipped += 1
+            return
+
+        sent.update(changed)
+        if any(isinstance(value, (list, tuple)) for value in changed.values()):
+            self.flush_buffer()
+            metrics.canvas_calls_issued += 1
+            start = timer()
+            self.canvas.itemconfigure(tag_or_id, **changed)
+            metrics.canvas_time += timer() - start
+            return
+
+        self.submit("itemconfigure", (tag_or_id,), changed)
+
+    itemconfig = itemconfigure
+
+    def tag_raise(self, tag_or_id: int | str, above: int | str | None = None):
+        if isinstance(tag_or_id, int) and above is None:
+            if self.buffering:
+                self.stacking.raise_item(tag_or_id)
+                return
+            self.stacking.raised(tag_or_id)
+        else:
+            self.stacking.invalidate()
+        self.submit("tag_raise", (tag_or_id,) if above is None else (tag_or_id, above))
+
+    lift = tag_raise
+
+    def raise_sorted(self, id: int, group: str, key: float):
+        """
+        Raises id like tag_raise(), but all items of the same group end up
+        together, where the first of them was raised, ordered by key.
+        """
+        if not self.buffering:
+            self.tag_raise(id)
+            return
+        self.stacking.raise_sorted(id, group, key)
+
+    def stacking_mark(self) -> int:
+        return self.stacking.mark()
+
+    def raised_since(self, mark: int) -> list[int] | None:
+        """Items raised in this frame since stacking_mark() returned mark."""
+        return self.stacking.raised_since(mark)
+
+    def raise_items(self, ids: list[int]):
+        """Raises ids in order, like one tag_raise() per item."""
+        self.stacking.raise_items(ids)
+
+    def tag_lower(self, tag_or_id: int | str, below: int | str | None = None):
+        self.stacking.invalidate()
+        self.submit("tag_lower", (tag_or_id,) if below is None else (tag_or_id, below))
+
+    def move(self, tag_or_id: int | str, dx: float, dy: float):
+        self.forget_tag(tag_or_id)
+        self.submit("move", (tag_or_id, dx, dy))
+
+    def reuse(self, id: int, type: str, args: tuple[Any, ...], kw: dict[str, Any]):
+        self.dropped.discard(id)
+        tags = kw.pop("tags", ())
+        tags = tags if isinstance(tags, str) else " ".join(map(str, tags))
+        options = {**item_defaults[type], "state": "normal", **kw, "tags": tags}
+        coords = tuple(args[0]) if len(args) == 1 else args
+
+        self.submit("coords", (id, *coords))
+        if any(isinstance(value, (list, tuple)) for value in options.values()):
+            self.flush_buffer()
+            metrics.canvas_calls_issued += 1
+            start = timer()
+            self.canvas.itemconfigure(id, **options)
+            metrics.canvas_time += timer() - start
+        else:
+            self.submit("itemconfigure", (id,), options)
+        self.submit("tag_raise", (id,))
+
+    def recycle(self, ids: Iterable[int]) -> set[int]:
+        """Forgets deleted items and returns the ones kept in the pool."""
+        pooled = set()
+        ids = list(ids)
+        self.stacking.deleted(ids)
+        for id in ids:
+            self.forget(id)
+            for group in self.item_groups.pop(id, ()):
+                self.group_items.get(group, set()).discard(id)
+
+            tag = str(id)
+            for sequence in self.bound.get(tag, ()):
+                self.handlers.pop(("tag", tag, sequence), None)
+            type = self.item_types.pop(id, None)
+            if type is not None and self.pool.give(type, id):
+                pooled.add(id)
+            else:
+                self.bound.pop(tag, None)
+        return pooled
+
+    def begin_create(self, groups: tuple[str, ...]):
+        self.creating.append(groups)
+
+    def end_create(self):
+        self.creating.pop()
+
+    def offset(self, groups: tuple[str, ...]) -> tuple[float, float]:
+        if len(self.moved) == 0:
+            return 0, 0
+        x = 0.0
+        y = 0.0
+        for group in groups:
+            dx, dy = self.moved.get(group, (0.0, 0.0))
+            x += dx
+            y += dy
+        return x, y
+
+    def place_group(self, group: str, parents: tuple[str, ...], x: float, y: float):
+        """
+        Places the origin of a group inside its parent groups. When it moved
+        relative to them, all of its items are moved with one call.
+        """
+        px, py = self.offset(parents)
+        placed = self.placed.get(group)
+        self.placed[group] = (x, y, px, py)
+        if placed is None:
+            return
+
+        last_x, last_y, last_px, last_py = placed
+        dx = x - (last_x + px - last_px)
+        dy = y - (last_y + py - last_py)
+        if dx == 0 and dy == 0:
+            return
+
+        mx, my = self.moved.get(group, (0.0, 0.0))
+        self.moved[group] = (mx + dx, my + dy)
+        self.submit("move", (group, dx, dy))
+
+    def park_group(self, group: str, parents: tuple[str, ...]):
+        """
+        Moves a placed group far outside the canvas and out of the paint
+        order, until place_group() puts it back.
+        """
+        placed = self.placed.get(group)
+        if placed is not None:
+            x, y, _, _ = placed
+            self.place_group(group, parents, x + parked_offset, y + parked_offset)
+        self.stacking.deleted(self.group_items.get(group, ()))
+
+    def delete(self, *tags_or_ids: int | str):
+        remaining = []
+        hidden = {"state": "hidden", "tags": ""}
+        for tag_or_id in tags_or_ids:
+            if isinstance(tag_or_id, int):
+                if tag_or_id in self.dropped:
+                    self.dropped.discard(tag_or_id)
+                    metrics.canvas_calls_skipped += 1
+                    continue
+                ids = (tag_or_id,)
+            elif tag_or_id in self.group_items:
+                ids = self.group_items.pop(tag_or_id)
+                self.placed.pop(tag_or_id, None)
+                self.moved.pop(tag_or_id, None)
+                if len(ids) == 0:
+                    metrics.canvas_calls_skipped += 1
+                    continue
+                self.dropped.update(ids)
+            else:
+                self.flush_buffer()
+                ids = self.canvas.find_withtag(tag_or_id)
+
+            pooled = self.recycle(ids)
+            if len(pooled) == 0:
+                remaining.append(tag_or_id)
+            elif len(pooled) == len(ids):
+                self.submit("itemconfigure", (tag_or_id,), hidden)
+            else:
+                for id in pooled:
+                    self.submit("itemconfigure", (id,), hidden)
+                remaining.extend(id for id in ids if id not in pooled)
+
+        if len(remaining) == 0:
+            return
+        self.flush_buffer()
+        start = timer()
+        self.canvas.delete(*remaining)
+        metrics.canvas_time += timer() - start
+
+    def forget(self, id: int):
+        self.sent_coords.pop(id, None)
+        self.sent_options.pop(id, None)
+
+    def forget_tag(self, tag_or_id: int | str):
+        if isinstance(tag_or_id, int):
+            self.forget(tag_or_id)
+            return
+
+        ids = self.group_items.get(tag_or_id)
+        if ids is None:
+            self.flush_buffer()
+            ids = self.canvas.find_withtag(tag_or_id)
+        for id in ids:
+            self.forget(id)
+
+    def bind_handler(
+        self, kind: str, tag: str, sequence: str, func: Callable
+    ) -> Callable:
+        def handler(e: Event):
+            recorder.record_event(kind, tag, sequence, e)
+            return func(e)
+
+        return handler
+
+    def tag_handler(self, tag: str, sequence: str) -> Callable:
+        def handler(e: Event):
+            if recorder.active and tag in self.group_items:
+                e.item = self.current_item(e)  # type: ignore
+            recorder.record_event("tag", tag, sequence, e)
+            for func in list(self.handlers.get(("tag", tag, sequence), {}).values()):
+                if func(e) == "break":
+                    return "break"
+
+        return handler
+
+    def current_item(self, e: Event) -> int | None:
+        """
+        The item under the pointer when e was delivered, recorded in the
+        event for replayed group events, else the canvas current item.
+        """
+        item = getattr(e, "item", None)
+        if item is None:
+            ids = self.canvas.find_withtag("current")
+            item = ids[0] if len(ids) > 0 else None
+        return item
+
+    def register_handler(
+        self, key: tuple[str, str, str], funcid: str, func: Callable, add: Any
+    ):
+        if not add:
+            self.handlers.pop(key, None)
+        self.handlers.setdefault(key, {})[funcid] = func
+
+    def unregister_handler(self, key: tuple[str, str, str], funcid: str | None):
+        if funcid is None:
+            self.handlers.pop(key, None)
+        elif key in self.handlers:
+            self.handlers[key].pop(funcid, None)
+
+    def tag_bind(
+        self, tag_or_id: int | str, sequence: str, func: Callable, add: Any = None
+    ) -> str:
+        tag = str(tag_or_id)
+        bound = self.bound.setdefault(tag, {})
+        if sequence not in bound:
+            bound[sequence] = self.canvas.tag_bind(
+                tag_or_id, sequence, self.tag_handler(tag, sequence)
+            )
+
+        funcid = f"tag_bind{next(funcids)}"
+        self.register_handler(("tag", tag, sequence), funcid, func, add)
+        return funcid
+
+    def tag_unbind(
+        self, tag_or_id: int | str, sequence: str, funcid: str | None = None
+    ):
+        key = ("tag", str(tag_or_id), sequence)
+        self.unregister_handler(key, funcid)
+        if isinstance(tag_or_id, int) or len(self.handlers.get(key, {})) > 0:
+            return
+
+        bound = self.bound.get(key[1], {})
+        if sequence in bound:
+            self.canvas.tag_unbind(tag_or_id, sequence, bound.pop(sequence))
+
+    def bind(self, sequence: str, func: Callable, add: Any = None) -> str:
+        key = ("widget", "", sequence)
+        funcid = self.canvas.bind(sequence, self.bind_handler(*key, func), add)
+        self.register_handler(key, funcid, func, add)
+        return funcid
+
+    def unbind(self, sequence: str, funcid: str | None = None):
+        self.unregister_handler(("widget", "", sequence), funcid)
+        self.canvas.unbind(sequence, funcid)
+
+    def dispatch(self, kind: str, tag: str, sequence: str, e: Event):
+        for func in list(self.handlers.get((kind, tag, sequence), {}).values()):
+            func(e)
@@ -0,0 +1,14 @@
+from timeit import default_timer as timer
+
+
+class Clock:
+    def __init__(self):
+        self.fixed: float | None = None
+
+    def now(self) -> float:
+        if self.fixed is not None:
+            return self.fixed
+        return timer()
+
+
+clock = Clock()
@@ -1,27 +1,260 @@
 from __future__ import annotations
 import copy
 from abc import ABC, abstractmethod
+from itertools import count
 from tkinter import Canvas
 from tkinter.font import Font
+from engine import fonts
 from typing import Any, Literal
-from timeit import default_timer as timer
-from engine.entities.state import EntityState
+from engine.clock import clock
+from engine.entities.state import EntityState, overlay_state
 from engine.entities.types import BoundValue
 
 from engine.models import Color, FrameContext, Position, Size, Constraints
-from engine.entities.components.base import Component
+from engine.entities.components.base import Component, Components
+from engine.scheduler import scheduler
+from engine.text import text_metrics
+
+
+class LayoutWatch:
+    """
+    Collects, while a subtree is laid out, the entities in it whose layout
+    can go stale on its own (bound state or layout components), so a clean
+    subtree can hand them up without being walked.
+    """
+
+    def __init__(self):
+        self.stack: list[list[Entity]] = []
+
+    def begin(self):
+        self.stack.append([])
+
+    def end(self) -> list[Entity]:
+        return self.stack.pop()
+
+    def collect(self, entities: list[Entity]):
+        if len(self.stack) > 0:
+            self.stack[-1].extend(entities)
+
+
+class PaintOrder:
+    """
+    The entities of a scene in paint order, each with the index of the entity
+    it is painted from and its offset to the position that entity's paint
+    returned. Painting walks the list instead of descending the tree, the
+    list is compiled again from paint_children after the tree was laid out.
+    The subtree of a frozen entity is compiled into a paint order of its own.
+    """
+
+    def __init__(self):
+        self.entries: list[tuple[Entity, int, float, float]] = []
+        self.stale = True
+
+    def compile(self, roots: list[tuple[Entity, float, float]]):
+        entries: list[tuple[Entity, int, float, float]] = []
+        pending = [(root, -1, x, y) for root, x, y in reversed(roots)]
+        while len(pending) > 0:
+            entity, parent, x, y = pending.pop()
+            index = len(entries)
+            entries.append((entity, parent, x, y))
+            if entity._frozen_order is not None:
+                entity._frozen_order.compile(entity.paint_children())
+                continue
+            for child, cx, cy in reversed(entity.paint_children()):
+                pending.append((child, index, cx, cy))
+
+        self.entries = entries
+        self.stale = False
+
+    def paint(self, ctx: FrameContext, origin: Position | None = None):
+        origins: list[Position] = []
+        for entity, parent, x, y in self.entries:
+            base = origins[parent] if parent >= 0 else origin
+            if base is not None:
+                x += base.x
+                y += base.y
+            pos = entity.paint(ctx, Position(x=x, y=y))
+            origins.append(pos)
+            if entity._frozen_order is not None:
+                entity.paint_frozen(ctx, pos)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def outside_canvas(
+    ctx: FrameContext, x: float, y: float, width: float, height: float
+) -> bool:
+    return x > ctx.width or y > ctx.height or x + width < 0 or y + height < 0
+
+
+layout_watch = LayoutWatch()
+group_ids = count(1)
 
 
 class Entity(ABC):
     state: Any
     canvas: Canvas
+    parent: Entity | None = None
+    groups: tuple[str, ...] = ()
+    _culled_at: tuple[float, float, float, float] | None = None
 
     @abstractmethod
-    def __init__(self, *, tag: str | None, components: list[Component] = []):
+    def __init__(
+        self,
+        *,
+        tag: str | None,
+        components: list[Component] = [],
+        group: bool = False,
+        frozen: bool = False,
+    ):
         self.id = 0
         self.tag = tag
-        self.components = components
+        self.group = f"group{next(group_ids)}" if group or frozen else None
+        self._frozen_order = PaintOrder() if frozen else None
+        self._frozen_items: list[int] | None = None
+        self._frozen_origin = (0.0, 0.0)
+        self._frozen_culled: list[tuple[Entity, tuple[float, float, float, float]]] = []
         self._size = Size(width=0, height=0)
+        self._layout_dirty = True
+        self._layout_constraints: Constraints | None = None
+        self._layout_size = self._size
+        self._watched: list[Entity] = []
+        self._hidden = False
+        self.components = Components(components, owner=self)
+
+    def create_child(self, child: Entity, canvas: Canvas, slot: str | None = None):
+        """Creates a child, inside a group of its own when a slot is given."""
+        child.parent = self
+        child.groups = self.groups if self.group is None else (*self.groups, self.group)
+        if slot is not None:
+            child.groups = (*child.groups, slot)
+        canvas.begin_create(child.groups)  # type: ignore
+        child.create(canvas)
+        canvas.end_create()  # type: ignore
+
+    def place_group(self, position: Position):
+        """
+        Moves the items of a grouped entity along with its position, children
+        painted at the same place relative to it send no coords.
+        """
+        if self.group is not None:
+            self.canvas.place_group(  # type: ignore
+                self.group, self.groups, position.x, position.y
+            )
+
+    def paint_frozen(self, ctx: FrameContext, origin: Position):
+        """
+        Paints the subtree of a frozen entity. Until the entity is laid out
+        again, its items are left as last painted and only kept in the paint
+        order, moving the entity moves them through its group. A move that
+        takes an entity of the subtree into or out of the canvas paints the
+        subtree again, so that its culling stays right.
+        """
+        assert self._frozen_order is not None
+        if self._frozen_items is not None and not self.frozen_culling_changed(
+            ctx, origin
+        ):
+            self.canvas.raise_items(self._frozen_items)  # type: ignore
+            return
+
+        mark = self.canvas.stacking_mark()  # type: ignore
+        self._frozen_order.paint(ctx, origin)
+        self._frozen_items = self.canvas.raised_since(mark)  # type: ignore
+        self._frozen_origin = (origin.x, origin.y)
+        self._frozen_culled = [
+            (entity, entity._culled_at)
+            for entity, _, _, _ in self._frozen_order.entries
+            if entity._culled_at is not None
+        ]
+
+    def frozen_culling_changed(self, ctx: FrameContext, origin: Position) -> bool:
+        dx = origin.x - self._frozen_origin[0]
+        dy = origin.y - self._frozen_origin[1]
+        if dx == 0 and dy == 0:
+            return False
+
+        for entity, (x, y, width, height) in self._frozen_culled:
+            if outside_canvas(ctx, x + dx, y + dy, width, height) != entity._hidden:
+                return True
+        return False
+
+    def delete_group(self):
+        """Deletes all items of a grouped entity's subtree at once."""
+        if self.group is not None:
+            self.canvas.delete(self.group)
+
+    def invalidate(self):
+        """Lays the entity out again on the next frame."""
+        entity = self
+        while entity is not None and not entity._layout_dirty:
+            entity._layout_dirty = True
+            entity = entity.parent
+
+    def watches_layout(self) -> bool:
+        state = getattr(self, "state", None)
+        if isinstance(state, EntityState) and state.polled():
+            return True
+        return len(self.components.layouters) > 0
+
+    def layout_stale(self, ctx: FrameContext) -> bool:
+        state = getattr(self, "state", None)
+        if isinstance(state, EntityState) and state.stale():
+            return True
+        return any(
+            component.layout_stale(self, ctx) for component in self.components.layouters
+        )
+
+    def flex_factor(self) -> int:
+        return 0
+
+    def culled(self, ctx: FrameContext, position: Position, size: Size) -> bool:
+        """
+        Whether the entity is painted outside the canvas. Its items are hidden
+        when it leaves the canvas and shown again when it comes back.
+        """
+        self._culled_at = (position.x, position.y, size.width, size.height)
+        outside = outside_canvas(ctx, position.x, position.y, size.width, size.height)
+        if outside != self._hidden:
+            self._hidden = outside
+            self.set_items_state("hidden" if outside else "normal")
+        return outside
+
+    def set_items_state(self, state: Literal["normal", "hidden"]):
+        self.canvas.itemconfigure(
+            self.id if self.group is None else self.group, state=state
+        )
+
+    def measure(self, ctx: FrameContext, constraints: Constraints) -> Size:
+        """
+        layout() with memoization: a clean entity laid out with the same
+        constraints returns its last size without descending.
+        """
+        if (
+            not self._layout_dirty
+            and not ctx.size_changed
+            and constraints == self._layout_constraints
+        ):
+            layout_watch.collect(self._watched)
+            return self._layout_size
+
+        state = getattr(self, "state", None)
+        if isinstance(state, EntityState):
+            state.attach(self)
+
+        self._layout_constraints = constraints.copy()
+        layout_watch.begin()
+        size = self.layout(ctx, constraints)
+        watched = layout_watch.end()
+        if self.watches_layout():
+            watched.append(self)
+        layout_watch.collect(watched)
+
+        self._watched = watched
+        self._layout_size = size
+        self._layout_dirty = False
+        self._frozen_items = None
+        return size
 
     @abstractmethod
     def create(self, canvas: Canvas):
@@ -32,9 +265,17 @@ class Entity(ABC):
         pass
 
     @abstractmethod
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        """
+        Paints the entity's own items and returns the position its children
+        are painted from.
+        """
         pass
 
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        """The children painted after the entity, with their offsets."""
+        return []
+
     @abstractmethod
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         pass
@@ -43,13 +284,23 @@ class Entity(ABC):
         return f"{self.__class__.__name__}(tag={self.tag}, id={self.id})"
 
 
-class RootScene:
-    def __init__(
-        self,
-        *,
-        children: list[Entity] = [],
-    ):
+class Layer:
+    """
+    Top-level entities of a RootScene that are laid out and painted at their
+    own rate: every frame when rate is None, at most rate times per second
+    when it is positive, and only after something in them was invalidated or
+    went stale when it is 0. A layer skipped in a frame keeps its items as
+    last painted, in their place in the paint order.
+    """
+
+    def __init__(self, *, children: list[Entity] = [], rate: float | None = None):
         self.children = children
+        self.rate = rate
+        self.watched: list[Entity] = []
+        self.paint_order = PaintOrder()
+        self.updated: float | None = None
+        self.items: list[int] | None = None
+        self.due = True
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -60,20 +311,92 @@ class RootScene:
         for child in self.children:
             child.destroy()
 
-    def paint(self, ctx: FrameContext):
-        for child in self.children:
-            child.paint(ctx, Position.zero())
+    def invalidate_stale(self, ctx: FrameContext):
+        for entity in self.watched:
+            if not entity._layout_dirty and entity.layout_stale(ctx):
+                entity.invalidate()
+
+    def check_due(self, ctx: FrameContext, now: float) -> bool:
+        if self.rate is not None and self.updated is not None and self.rate > 0:
+            wait = 1 / self.rate - (now - self.updated)
+            if wait > 0 and self.items is not None and not ctx.size_changed:
+                scheduler.wake_in(wait)
+                return False
+
+        self.invalidate_stale(ctx)
+        if self.rate == 0 and self.items is not None and not ctx.size_changed:
+            return any(child._layout_dirty for child in self.children)
+        return True
 
     def layout(self, ctx: FrameContext):
+        now = clock.now()
+        self.due = self.check_due(ctx, now)
+        if not self.due:
+            return
+
+        self.updated = now
         constraints = Constraints(
             min_width=0, min_height=0, max_width=ctx.width, max_height=ctx.height
         )
+        if ctx.size_changed or any(child._layout_dirty for child in self.children):
+            self.paint_order.stale = True
 
+        layout_watch.begin()
         for child in self.children:
-            child.layout(ctx, constraints)
+            child._size = child.measure(ctx, constraints)
+        self.watched = layout_watch.end()
+
+    def paint(self, ctx: FrameContext):
+        if not self.due and self.items is not None:
+            self.canvas.raise_items(self.items)  # type: ignore
+            return
+
+        if self.paint_order.stale:
+            self.paint_order.compile([(child, 0, 0) for child in self.children])
+        if self.rate is None:
+            self.paint_order.paint(ctx)
+            return
+
+        mark = self.canvas.stacking_mark()  # type: ignore
+        self.paint_order.paint(ctx)
+        self.items = self.canvas.raised_since(mark)  # type: ignore
+
+
+class RootScene:
+    """
+    The entities of a window. children are updated every frame, layers are
+    painted above them in order, each at its own rate.
+    """
+
+    def __init__(
+        self,
+        *,
+        children: list[Entity] = [],
+        layers: list[Layer] = [],
+    ):
+        self.layers = [Layer(children=children), *layers]
+
+    def create(self, canvas: Canvas):
+        self.canvas = canvas
+        for layer in self.layers:
+            layer.create(canvas)
+
+    def destroy(self):
+        for layer in self.layers:
+            layer.destroy()
+
+    def paint(self, ctx: FrameContext):
+        for layer in self.layers:
+            layer.paint(ctx)
+
+    def layout(self, ctx: FrameContext):
+        for layer in self.layers:
+            layer.layout(ctx)
 
 
 class RectState:
+    __slots__ = ("size", "fill", "outline", "outline_width")
+
     def __init__(
         self, *, size: Size | None, fill: Color, outline: Color, outline_width: float
     ):
@@ -107,7 +430,7 @@ class Rect(Entity):
         self.state = RectState(
             size=size, fill=fill, outline=outline, outline_width=outline_width
         )
-        self._state = self.state.copy()
+        self._state = self.state
         self.child = child
 
     def create(self, canvas: Canvas):
@@ -119,7 +442,7 @@ class Rect(Entity):
             component.create(self)
 
         if self.child is not None:
-            self.child.create(canvas)
+            self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
@@ -128,37 +451,39 @@ class Rect(Entity):
         if self.child is not None:
             self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
         size = self._size.copy()
 
         self.canvas.tag_raise(self.id)
-        for effect in self.components:
-            effect.before_paint(self, ctx, pos, size, self._state)
+        self.components.before_paint(self, ctx, pos, size, state)
 
-        self.canvas.coords(
-            self.id, pos.x, pos.y, pos.x + size.width, pos.y + size.height
-        )
-        self.canvas.itemconfigure(
-            self.id,
-            fill=self._state.fill.to_hex(),
-            outline=self._state.outline.to_hex(),
-            width=self._state.outline_width,
-        )
+        if not self.culled(ctx, pos, size):
+            self.canvas.coords(
+                self.id, pos.x, pos.y, pos.x + size.width, pos.y + size.height
+            )
+            self.canvas.itemconfigure(
+                self.id,
+                fill=state.fill.to_hex(),
+                outline=state.outline.to_hex(),
+                width=state.outline_width,
+            )
 
-        if self.child is not None:
-            self.child.paint(ctx, pos)
+        return pos
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [] if self.child is None else [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         self._state = state
 
         if self.child is not None:
             new_constraints = constraints.limit(state.size)
-            self.child._size = self.child.layout(
+            self.child._size = self.child.measure(
                 ctx,
                 new_constraints.force_max() if state.size is not None else constraints,
             )
@@ -196,7 +521,7 @@ class PureRect(Entity):
         self.state = RectState(
             size=size, fill=fill, outline=outline, outline_width=outline_width
         )
-        self._state = self.state.copy()
+        self._state = self.state
         self.child = child
         self.position = position
 
@@ -206,37 +531,41 @@ class PureRect(Entity):
         self.id = canvas.create_rectangle(0, 0, 0, 0, tags=tags)
 
         if self.child is not None:
-            self.child.create(canvas)
+            self.create_child(self.child, canvas)
 
     def destroy(self):
         self.canvas.delete(self.id)
         if self.child is not None:
             self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         self.canvas.tag_raise(self.id)
 
-        self.canvas.coords(
-            self.id,
-            position.x + self.position.x,
-            position.y + self.position.y,
-            position.x + self.position.x + self._size.width,
-            position.y + self.position.y + self._size.height,
-        )
-        self.canvas.itemconfigure(
-            self.id,
-            fill=self._state.fill.to_hex(),
-            outline=self._state.outline.to_hex(),
-            width=self._state.outline_width,
-        )
+        pos = position.add(self.position)
+        if not self.culled(ctx, pos, self._size):
+            self.canvas.coords(
+                self.id,
+                pos.x,
+                pos.y,
+                pos.x + self._size.width,
+                pos.y + self._size.height,
+            )
+            self.canvas.itemconfigure(
+                self.id,
+                fill=self._state.fill.to_hex(),
+                outline=self._state.outline.to_hex(),
+                width=self._state.outline_width,
+            )
 
-        if self.child is not None:
-            self.child.paint(ctx, position)
+        return position
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [] if self.child is None else [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         if self.child is not None:
             new_constraints = constraints.limit(self.state.size)
-            self.child._size = self.child.layout(
+            self.child._size = self.child.measure(
                 ctx,
                 new_constraints.force_max()
                 if self.state.size is not None
@@ -267,8 +596,7 @@ class TextState(EntityState):
         font: Font,
         justify: Literal["left", "center", "right"],
     ):
-        self._bound_text = text
-        self.text = text()
+        self.bind("text", text)
         self.width = width
         self.fill = fill
         self.font = font
@@ -294,12 +622,13 @@ class Text(Entity):
         components: list[Component] = [],
     ):
         super().__init__(tag=tag, components=components)
-        f = font if font is not None else Font(family="Helvetica", size=12)
+        f = font if font is not None else fonts.Font(family="Helvetica", size=12)
         self.state = TextState(
             text=text, width=width, fill=fill, font=f, justify=justify
         )
-        self._state = self.state.copy()
+        self._state = self.state
         self._size = Size(width=0, height=0)
+        self.last_height = 0
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -314,43 +643,49 @@ class Text(Entity):
             component.destroy(self)
         self.canvas.delete(self.id)
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
         self.canvas.tag_raise(self.id)
-        for effect in self.components:
-            effect.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+
+        if self.culled(ctx, pos, self._size):
+            return pos
 
         self.canvas.coords(self.id, pos.x, pos.y)
         self.canvas.itemconfigure(
             self.id,
-            text=self._state.text,
-            fill=self._state.fill.to_hex(),
+            text=state.text,
+            fill=state.fill.to_hex(),
             width=self._size.width,
-            font=self._state.font,
-            justify=self._state.justify,
+            font=state.font,
+            justify=state.justify,
         )
+        return pos
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         self.state.update()
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         self._state = state
 
-        text_width = self._state.font.measure(state.text)
+        text_width = text_metrics.width(state.font, state.text)
         w = constraints.fit_width(text_width)
 
-        self.canvas.itemconfigure(
-            self.id, text=state.text, fill=state.fill.to_hex(), width=w, font=state.font
+        text_height = text_metrics.height(
+            self.canvas,
+            text=state.text,
+            font=state.font,
+            width=w,
+            justify=state.justify,
         )
-        bbox = self.canvas.bbox(self.id)
-        if bbox is None:
-            bbox = self.last_bbox
-        self.last_bbox = bbox
+        if text_height is None:
+            text_height = self.last_height
+        self.last_height = text_height
 
-        h = constraints.fit_height(bbox[3] - bbox[1])
+        h = constraints.fit_height(text_height)
 
         self._size = Size(width=w, height=h)
 
@@ -358,6 +693,8 @@ class Text(Entity):
 
 
 class SpriteState:
+    __slots__ = ("asset_key", "size")
+
     def __init__(self, *, asset_key: str, size: Size | None = None):
         self.asset_key = asset_key
         self.size = size
@@ -379,7 +716,7 @@ class Sprite(Entity):
     ):
         super().__init__(tag=tag, components=components)
         self.state = SpriteState(asset_key=asset_key, size=size)
-        self._state = self.state.copy()
+        self._state = self.state
         self._size = Size(width=10, height=10)
 
     def create(self, canvas: Canvas):
@@ -394,23 +731,26 @@ class Sprite(Entity):
             component.destroy(self)
         self.canvas.delete(self.id)
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
         self.canvas.tag_raise(self.id)
-        for effect in self.components:
-            effect.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+
+        if self.culled(ctx, pos, self._size):
+            return pos
 
         asset = ctx.asset_manager.get(
-            self._state.asset_key, int(self._size.width), int(self._size.height)
+            state.asset_key, int(self._size.width), int(self._size.height)
         )
         self.canvas.coords(self.id, pos.x, pos.y)
         self.canvas.itemconfigure(self.id, image=asset)
+        return pos
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         self._state = state
 
@@ -426,14 +766,12 @@ class AnimatedSpriteState(EntityState):
         size: Size | None = None,
         speed: float = 1.0,
     ):
-        self._bound_paused = paused
-        self.paused = paused()
-        self._bound_asset_key = asset_key
-        self.asset_key = asset_key()
+        self.bind("paused", paused)
+        self.bind("asset_key", asset_key)
         self.size = size
         self.speed = speed
         self.frame_idx = 0
-        self.frame_time = timer()
+        self.frame_time = clock.now()
 
     def copy(self):
         return copy.copy(self)
@@ -453,7 +791,7 @@ class AnimatedSprite(Entity):
     ):
         super().__init__(tag=tag, components=components)
         self.state = AnimatedSpriteState(asset_key=asset_key, size=size, paused=paused)
-        self._state = self.state.copy()
+        self._state = self.state
         self._size = Size(width=10, height=10)
 
     def set_asset_key(self, asset_key: str):
@@ -461,7 +799,8 @@ class AnimatedSprite(Entity):
             return
         self.state.asset_key = asset_key
         self.state.frame_idx = 0
-        self.state.frame_time = timer()
+        self.state.frame_time = clock.now()
+        self.invalidate()
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -475,17 +814,20 @@ class AnimatedSprite(Entity):
             component.destroy(self)
         self.canvas.delete(self.id)
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
         self.canvas.tag_raise(self.id)
-        for effect in self.components:
-            effect.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+
+        if self.culled(ctx, pos, self._size):
+            return pos
 
         asset_list = ctx.asset_manager.get_animated(
-            self._state.asset_key, int(self._size.width), int(self._size.height)
+            state.asset_key, int(self._size.width), int(self._size.height)
         )
-        raw_asset = ctx.asset_manager.get_raw(self._state.asset_key)
+        raw_asset = ctx.asset_manager.get_raw(state.asset_key)
 
         asset = None
         if (
@@ -493,26 +835,28 @@ class AnimatedSprite(Entity):
             and raw_asset is not None
             and raw_asset.animation is not None
         ):
-            now = timer()
+            now = clock.now()
             if (
-                now - self._state.frame_time
-                > self._state.speed * (1 / raw_asset.animation.fps)
-                and not self._state.paused
+                now - self.state.frame_time
+                > state.speed * (1 / raw_asset.animation.fps)
+                and not state.paused
             ):
                 self.state.frame_idx += 1
                 self.state.frame_time = now
 
             self.state.frame_idx %= len(asset_list)
             asset = asset_list[self.state.frame_idx]
+            if not state.paused:
+                scheduler.invalidate()
 
         self.canvas.coords(self.id, pos.x, pos.y)
         self.canvas.itemconfigure(self.id, image=asset)
+        return pos
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         self.state.update()
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         self._state = state
 
@@ -3,7 +3,7 @@ from abc import ABC
 
 from engine.models import FrameContext, Position, Size
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 if TYPE_CHECKING:
     from engine.entities.basic import Entity
@@ -29,6 +29,20 @@ class Component(ABC):
     def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
         pass
 
+    def affects_paint(self) -> bool:
+        return type(self).before_paint is not Component.before_paint
+
+    def affects_layout(self) -> bool:
+        return type(self).before_layout is not Component.before_layout
+
+    def layout_stale(self, entity: Entity, ctx: FrameContext) -> bool:
+        """
+        Whether before_layout would change anything if the entity was laid out
+        again. Components that override before_layout without overriding this
+        make the entity lay out every frame.
+        """
+        return self.affects_layout()
+
 
 class Hook(Component):
     def __init__(
@@ -56,6 +70,12 @@ class Hook(Component):
         if self._before_layout is not None:
             self._before_layout(entity, ctx, state)
 
+    def affects_paint(self) -> bool:
+        return self._before_paint is not None
+
+    def affects_layout(self) -> bool:
+        return self._before_layout is not None
+
 
 class LeaveOriginal:
     pass
@@ -65,14 +85,22 @@ class Bind(Component):
     def __init__(self, property: str, getter: Callable):
         self.property = property
         self.getter = getter
+        self.value: Any = LeaveOriginal()
 
     def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
         val = self.getter()
+        self.value = val
         if isinstance(val, LeaveOriginal):
             return
 
         setattr(state, self.property, val)
 
+    def layout_stale(self, entity: Entity, ctx: FrameContext) -> bool:
+        val = self.getter()
+        if isinstance(val, LeaveOriginal):
+            return not isinstance(self.value, LeaveOriginal)
+        return val != self.value
+
 
 class PaintBind(Component):
     def __init__(self, property: str, getter: Callable):
@@ -96,7 +124,7 @@ class PaintBind(Component):
 
 class PositionGroup(Component):
     def __init__(self, components: list[Component]):
-        self.components = components
+        self.components = Components(components)
 
     def create(self, entity: Entity):
         for component in self.components:
@@ -115,11 +143,131 @@ class PositionGroup(Component):
         state: Any | None,
     ):
         pos = Position.zero()
-        for component in self.components:
-            component.before_paint(entity, ctx, pos, size, state)
-
+        self.components.before_paint(entity, ctx, pos, size, state)
         position.mut_add(pos)
 
     def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
-        for component in self.components:
-            component.before_layout(entity, ctx, state)
+        self.components.before_layout(entity, ctx, state)
+
+    def affects_paint(self) -> bool:
+        return len(self.components.painters) > 0
+
+    def affects_layout(self) -> bool:
+        return len(self.components.layouters) > 0
+
+    def layout_stale(self, entity: Entity, ctx: FrameContext) -> bool:
+        return any(
+            component.layout_stale(entity, ctx)
+            for component in self.components.layouters
+        )
+
+
+def skip_paint(
+    entity: Entity,
+    ctx: FrameContext,
+    position: Position,
+    size: Size,
+    state: Any | None,
+):
+    pass
+
+
+def skip_layout(entity: Entity, ctx: FrameContext, state: Any | None):
+    pass
+
+
+def paint_chain(painters: tuple[Component, ...]) -> Callable[..., None]:
+    if len(painters) == 0:
+        return skip_paint
+    if len(painters) == 1:
+        return painters[0].before_paint
+
+    calls = tuple(component.before_paint for component in painters)
+
+    def before_paint(
+        entity: Entity,
+        ctx: FrameContext,
+        position: Position,
+        size: Size,
+        state: Any | None,
+    ):
+        for call in calls:
+            call(entity, ctx, position, size, state)
+
+    return before_paint
+
+
+def layout_chain(layouters: tuple[Component, ...]) -> Callable[..., None]:
+    if len(layouters) == 0:
+        return skip_layout
+    if len(layouters) == 1:
+        return layouters[0].before_layout
+
+    calls = tuple(component.before_layout for component in layouters)
+
+    def before_layout(entity: Entity, ctx: FrameContext, state: Any | None):
+        for call in calls:
+            call(entity, ctx, state)
+
+    return before_layout
+
+
+class Components(list[Component]):
+    """
+    The components of an entity. The ones overriding before_paint and
+    before_layout are kept in painters and layouters, and each hook chain is
+    fused into a single before_paint / before_layout call. Both are rebuilt
+    whenever the list changes, e.g. when a component removes itself, and the
+    owner is laid out again when its layouters changed.
+    """
+
+    painters: tuple[Component, ...]
+    layouters: tuple[Component, ...]
+    before_paint: Callable[[Entity, FrameContext, Position, Size, Any | None], None]
+    before_layout: Callable[[Entity, FrameContext, Any | None], None]
+
+    def __init__(
+        self, components: Iterable[Component] = (), owner: Entity | None = None
+    ):
+        super().__init__(components)
+        self.owner: Entity | None = None
+        self.changed()
+        self.owner = owner
+
+    def changed(self):
+        layouters = tuple(c for c in self if c.affects_layout())
+        if self.owner is not None and layouters != self.layouters:
+            self.owner.invalidate()
+
+        self.painters = tuple(c for c in self if c.affects_paint())
+        self.layouters = layouters
+        self.before_paint = paint_chain(self.painters)
+        self.before_layout = layout_chain(self.layouters)
+
+
+def rebuilds_chains(name: str):
+    method = getattr(list, name)
+
+    def mutate(self: Components, *args: Any, **kwargs: Any):
+        result = method(self, *args, **kwargs)
+        self.changed()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+):
+    setattr(Components, name, rebuilds_chains(name))
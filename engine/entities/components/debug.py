@@ -1,4 +1,5 @@
 from engine.logger import logger
+from engine.metrics import frame_times, phases
 from engine.entities.components.base import Component
 from engine.entities.basic import Entity
 from engine.models import FrameContext, Position, Size, Color
@@ -9,19 +10,19 @@ from timeit import default_timer as timer
 class FpsCounter(Component):
     def __init__(self, period: int = 10):
         self.period = period
-        self.frames_passed = 0
         self.text = "Calculating..."
 
     def create(self, entity):
         self.start_time = timer()
+        self.start_frame = frame_times.total
 
     def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
-        self.frames_passed += 1
-        if self.frames_passed >= self.period:
-            self.frames_passed = 0
+        frames = frame_times.total - self.start_frame
+        if frames >= self.period:
             now = timer()
-            self.text = f"{self.period / (now - self.start_time):.2f} fps"
+            self.text = f"{frames / (now - self.start_time):.2f} fps"
             self.start_time = now
+            self.start_frame = frame_times.total
 
         if state is None or not hasattr(state, "text"):
             raise Exception(
@@ -108,6 +109,46 @@ class AssetLoaderStats(Component):
         )
 
 
+class FrameTimeStats(Component):
+    def __init__(self, period: int = 10):
+        self.period = period
+        self.last_frame: int | None = None
+        self.text = ""
+
+    def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
+        if state is None or not hasattr(state, "text"):
+            raise Exception(
+                "FrameTimeStats component must be on an entity which supports text"
+            )
+
+        if (
+            self.last_frame is None
+            or frame_times.total - self.last_frame >= self.period
+        ):
+            self.last_frame = frame_times.total
+            summary = frame_times.summary()
+            self.text = (
+                f"p50 {summary.p50 * 1000:.1f} / p95 {summary.p95 * 1000:.1f} / "
+                f"p99 {summary.p99 * 1000:.1f} / max {summary.max * 1000:.1f} ms\n"
+                f"Over budget: {summary.over_budget} / {summary.frames}"
+            )
+
+        state.text = self.text
+
+
+class FramePhaseStats(Component):
+    def before_layout(self, entity: Entity, ctx: FrameContext, state: Any | None):
+        if state is None or not hasattr(state, "text"):
+            raise Exception(
+                "FramePhaseStats component must be on an entity which supports text"
+            )
+
+        state.text = (
+            f"Layout {phases.layout * 1000:.1f} / Paint {phases.paint * 1000:.1f} ms\n"
+            f"Canvas {phases.canvas * 1000:.1f} / Idle {phases.idle * 1000:.1f} ms"
+        )
+
+
 class PrintLifecycle(Component):
     def __init__(
         self,
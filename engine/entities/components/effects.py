@@ -2,10 +2,11 @@ from __future__ import annotations
 from random import random
 from abc import ABC, abstractmethod
 from typing import Any
-from timeit import default_timer as timer
+from engine.clock import clock
 
 from engine.models import Color, Position, Size, FrameContext
 from engine.traits import Transitionable
+from engine.scheduler import scheduler
 from engine.animation.utils import Easing
 from engine.entities.basic import Entity
 from engine.entities.components.base import Component
@@ -89,6 +90,8 @@ class ObjectTransition(Component, ABC):
             raise Exception("Either speed or duration must be set")
 
         self.progress = min(self.progress, 1)
+        if self.progress < 1:
+            scheduler.invalidate()
 
         self.value = self.last_value.interpolate(
             self.target_value, self.easing(self.progress)
@@ -166,6 +169,8 @@ class ObjectLayoutTransition(Component, ABC):
             raise Exception("Either speed or duration must be set")
 
         self.progress = min(self.progress, 1)
+        if self.progress < 1:
+            scheduler.invalidate()
 
         self.value = self.last_value.interpolate(
             self.target_value, self.easing(self.progress)
@@ -173,6 +178,9 @@ class ObjectLayoutTransition(Component, ABC):
 
         self.setter(entity, ctx, state, self.value)
 
+    def layout_stale(self, entity: Entity, ctx: FrameContext) -> bool:
+        return self.progress < 1 and self.distance != 0
+
 
 class PositionTransition(ObjectTransition):
     def __init__(
@@ -329,6 +337,7 @@ class SquareShake(Component):
         size: Size,
         state: object | None,
     ):
+        scheduler.invalidate()
         self.each -= ctx.delta_time
         if self.each <= 0:
             self.offset_x = random() * self.x_spread - self.x_spread / 2
@@ -391,7 +400,7 @@ class StartOnFill(Component):
         self.done = False
 
     def create(self, entity: Entity):
-        self.start = timer()
+        self.start = clock.now()
 
     def before_paint(
         self,
@@ -410,7 +419,8 @@ class StartOnFill(Component):
             )
 
         state.fill = self.fill
+        scheduler.invalidate()
 
-        if timer() - self.start > self.delay:
+        if clock.now() - self.start > self.delay:
             entity.canvas.after_idle(lambda: entity.components.remove(self))
             self.done = True
@@ -1,17 +1,85 @@
 import copy
+from collections import OrderedDict
 from tkinter import Canvas
-from typing import Any, Callable
-from engine.entities.basic import Entity
+from typing import Any, Callable, Hashable, Protocol
+from engine.entities.basic import Entity, group_ids
 from engine.entities.components.base import Component
-from engine.entities.state import EntityState
+from engine.entities.state import EntityState, overlay_state
 from engine.entities.types import BoundValue
 from engine.models import Constraints, FrameContext, Position, Size
 
 
+class KeyedContainer(Protocol):
+    def add(self, child: Any) -> None: ...
+
+    def remove(self, child: Any) -> None: ...
+
+
+class Subtrees:
+    """
+    The child of a switching entity. With keep_alive set, every child is
+    created in a group of its own and switching away parks it outside the
+    canvas instead of destroying it, so switching back only places it again.
+    At most keep_alive inactive children are kept per switch, the least
+    recently used one is destroyed first.
+    """
+
+    def __init__(self, owner: Entity, keep_alive: int):
+        self.owner = owner
+        self.keep_alive = keep_alive
+        self.key: Any = None
+        self.current: Entity
+        self.slot: str | None = None
+        self.parked: OrderedDict[Any, tuple[Entity, str | None]] = OrderedDict()
+
+    def create(self, key: Any, build: Callable[[], Entity]):
+        self.key = key
+        self.slot = f"group{next(group_ids)}" if self.keep_alive > 0 else None
+        self.current = build()
+        self.owner.create_child(self.current, self.owner.canvas, self.slot)
+
+    def switch(self, key: Any, build: Callable[[], Entity]):
+        if self.slot is None:
+            self.owner.delete_group()
+            self.current.destroy()
+            self.create(key, build)
+            return
+
+        self.owner.canvas.park_group(self.slot, self.current.groups[:-1])  # type: ignore
+        self.parked[self.key] = (self.current, self.slot)
+        parked = self.parked.pop(key, None)
+        if parked is None:
+            self.create(key, build)
+        else:
+            self.key = key
+            self.current, self.slot = parked
+
+        while len(self.parked) > self.keep_alive:
+            _, (entity, slot) = self.parked.popitem(last=False)
+            self.delete(entity, slot)
+
+    def place(self, position: Position):
+        if self.slot is not None:
+            self.owner.canvas.place_group(  # type: ignore
+                self.slot, self.current.groups[:-1], position.x, position.y
+            )
+
+    def delete(self, entity: Entity, slot: str | None):
+        if slot is not None:
+            self.owner.canvas.delete(slot)
+        entity.destroy()
+
+    def destroy(self):
+        self.owner.delete_group()
+        for entity, slot in self.parked.values():
+            self.delete(entity, slot)
+        self.parked.clear()
+        self.delete(self.current, self.slot)
+
+
 class EntitySwitchState(EntityState):
     def __init__(self, current: BoundValue[Any]):
-        self._bound_current = current
-        self.current = current()
+        self.bind("current", current)
 
     def copy(self):
         return copy.copy(self)
@@ -27,48 +95,57 @@ class EntitySwitch(Entity):
         components: list[Component] = [],
         current: BoundValue[Any],
         entities: dict[Any, Callable[[], Entity]],
+        group: bool = False,
+        keep_alive: int = 0,
     ):
-        super().__init__(tag=tag, components=components)
+        super().__init__(tag=tag, components=components, group=group)
         self.state = EntitySwitchState(current=current)
-        self._state = self.state.copy()
+        self._state = self.state
         self.entities = entities
+        self.subtrees = Subtrees(self, keep_alive)
         self._size = Size(width=0, height=0)
 
+    @property
+    def current(self) -> Entity:
+        return self.subtrees.current
+
     def create(self, canvas: Canvas):
         self.canvas = canvas
 
         for component in self.components:
             component.create(self)
 
-        self.current = self.entities[self.state.current]()
-        self.current.create(canvas)
+        key = self.state.current
+        self.subtrees.create(key, self.entities[key])
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
 
-        self.current.destroy()
+        self.subtrees.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
-        for component in self.components:
-            component.before_paint(self, ctx, position, self._size, self._state)
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        state = overlay_state(self._state, self.components.painters)
+        self.components.before_paint(self, ctx, position, self._size, state)
+        self.place_group(position)
+        self.subtrees.place(position)
+        return position
 
-        self.current.paint(ctx, position)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.current, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         changed = self.state.update()
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         if "current" in changed:
-            self.current.destroy()
-            self.current = self.entities[self.state.current]()
-            self.current.create(self.canvas)
+            key = self.state.current
+            self.subtrees.switch(key, self.entities[key])
 
         self._state = state
 
-        child_size = self.current.layout(ctx, constraints)
+        child_size = self.current.measure(ctx, constraints)
         self.current._size = child_size
 
         return child_size
@@ -76,14 +153,21 @@ class EntitySwitch(Entity):
 
 class ReactiveState(EntityState):
     def __init__(self, dependency: BoundValue[Any]):
-        self._bound_dependency = dependency
-        self.dependency = dependency()
+        self.bind("dependency", dependency)
 
     def copy(self):
         return copy.copy(self)
 
 
 class Reactive(Entity):
+    """
+    Rebuilds its child when the dependency changes. With keyed set, the
+    child built once is a container (with add() and remove()) and keyed
+    returns a factory per child key: on a change only children of new keys
+    are built and added and only those of removed keys are removed, the
+    others are kept as they are.
+    """
+
     def __init__(
         self,
         *,
@@ -91,12 +175,24 @@ class Reactive(Entity):
         components: list[Component] = [],
         dependency: BoundValue[Any],
         builder: BoundValue[Entity],
+        keyed: Callable[[], dict[Hashable, Callable[[], Any]]] | None = None,
+        group: bool = False,
+        keep_alive: int = 0,
     ):
-        super().__init__(tag=tag, components=components)
+        super().__init__(tag=tag, components=components, group=group)
+        if keyed is not None and keep_alive > 0:
+            raise Exception("Reactive can either keep subtrees alive or be keyed")
+
         self.state = ReactiveState(dependency=dependency)
-        self._state = self.state.copy()
+        self._state = self.state
         self.child_builder = builder
-        self.child = builder()
+        self.keyed = keyed
+        self.keyed_children: dict[Hashable, Any] = {}
+        self.subtrees = Subtrees(self, keep_alive)
+
+    @property
+    def child(self) -> Entity:
+        return self.subtrees.current
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -104,35 +200,52 @@ class Reactive(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child = self.child_builder()
-        self.child.create(canvas)
+        self.subtrees.create(self.state.dependency, self.child_builder)
+        self.reconcile()
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
 
-        self.child.destroy()
+        self.subtrees.destroy()
+        self.keyed_children = {}
 
-    def paint(self, ctx: FrameContext, position: Position):
-        for component in self.components:
-            component.before_paint(self, ctx, position, self._size, self._state)
+    def reconcile(self):
+        if self.keyed is None:
+            return
+
+        container: KeyedContainer = self.child  # type: ignore
+        factories = self.keyed()
+        for key in [key for key in self.keyed_children if key not in factories]:
+            container.remove(self.keyed_children.pop(key))
+        for key, factory in factories.items():
+            if key not in self.keyed_children:
+                self.keyed_children[key] = factory()
+                container.add(self.keyed_children[key])
 
-        self.child.paint(ctx, position)
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        state = overlay_state(self._state, self.components.painters)
+        self.components.before_paint(self, ctx, position, self._size, state)
+        self.place_group(position)
+        self.subtrees.place(position)
+        return position
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         changed = self.state.update()
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
-        if "dependency" in changed:
-            self.child.destroy()
-            self.child = self.child_builder()
-            self.child.create(self.canvas)
+        if "dependency" in changed and self.keyed is not None:
+            self.reconcile()
+        elif "dependency" in changed:
+            self.subtrees.switch(self.state.dependency, self.child_builder)
 
         self._state = state
 
-        child_size = self.child.layout(ctx, constraints)
+        child_size = self.child.measure(ctx, constraints)
         self.child._size = child_size
 
         return child_size
@@ -0,0 +1,277 @@
+from __future__ import annotations
+from array import array
+from operator import add
+from tkinter import Canvas, Event
+from typing import Any, Callable, Iterable, Literal
+
+from engine.animation.utils import Easing
+from engine.clock import clock
+from engine.entities.basic import Entity
+from engine.entities.components.base import Component
+from engine.models import Color, Constraints, FrameContext, Position, Size
+from engine.scheduler import scheduler
+
+type InstanceCallback = Callable[[Event, int], Any]
+
+
+class Instances(Entity):
+    """
+    Many rectangles or lines owned by one entity and described by parallel
+    arrays. Instance i spans from (x[i], y[i]) to (x[i] + width[i],
+    y[i] + height[i]) relative to the entity and is filled with
+    palette[fill[i]]. The items share the entity's group tag, so moving the
+    entity is a single canvas call, and only instances changed since the last
+    paint send their coords or fill. Pointer callbacks get the index of the
+    canvas current item.
+    """
+
+    def __init__(
+        self,
+        *,
+        tag: str | None = None,
+        shape: Literal["rectangle", "line"] = "rectangle",
+        palette: list[Color],
+        x: Iterable[float] = (),
+        y: Iterable[float] = (),
+        width: Iterable[float] = (),
+        height: Iterable[float] = (),
+        fill: Iterable[int] = (),
+        outline: Color = Color.black(),
+        line_width: float = 1.0,
+        duration: float = 0,
+        easing=Easing.linear,
+        on_enter: InstanceCallback | None = None,
+        on_leave: InstanceCallback | None = None,
+        on_click: InstanceCallback | None = None,
+        components: list[Component] = [],
+    ):
+        super().__init__(tag=tag, components=components, group=True)
+        self.shape = shape
+        self.palette = palette
+        self.x = array("d", x)
+        self.y = array("d", y)
+        self.width = array("d", width)
+        self.height = array("d", height)
+        self.fill = array("H", fill)
+        if not (
+            len(self.x)
+            == len(self.y)
+            == len(self.width)
+            == len(self.height)
+            == len(self.fill)
+        ):
+            raise Exception("Instances need the same number of values per array")
+
+        self.outline = outline
+        self.line_width = line_width
+        self.duration = duration
+        self.easing = easing
+        self.on_enter = on_enter
+        self.on_leave = on_leave
+        self.on_click = on_click
+
+        self.created = False
+        self.ids: list[int] = []
+        self.indexes: dict[int, int] = {}
+        self.bindings: list[tuple[str, str]] = []
+        self.changed: set[int] = set()
+        self.all_changed = True
+        self.fading: dict[int, tuple[Color, float, float]] = {}
+        self.hovered: int | None = None
+        self.extent: Size | None = None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def add(
+        self, x: float, y: float, width: float, height: float, fill: int = 0
+    ) -> int:
+        index = len(self.x)
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        self.fill.append(fill)
+        self.changed.add(index)
+        self.extent = None
+        self.invalidate()
+
+        if self.created:
+            self.create_items()
+        return index
+
+    def set_bounds(self, index: int, x: float, y: float, width: float, height: float):
+        bounds = (self.x[index], self.y[index], self.width[index], self.height[index])
+        if bounds == (x, y, width, height):
+            return
+
+        self.x[index] = x
+        self.y[index] = y
+        self.width[index] = width
+        self.height[index] = height
+        self.changed.add(index)
+        self.extent = None
+        self.invalidate()
+
+    def set_fill(
+        self,
+        index: int,
+        fill: int,
+        *,
+        delay: float = 0,
+        duration: float | None = None,
+    ):
+        """
+        Fills an instance with palette[fill], fading from its current color
+        after delay seconds when a duration is set.
+        """
+        if fill == self.fill[index] and index not in self.fading:
+            return
+
+        duration = self.duration if duration is None else duration
+        if delay > 0 or duration > 0:
+            now = clock.now()
+            self.fading[index] = (self.color(index, now), now + delay, duration)
+        else:
+            self.fading.pop(index, None)
+
+        self.fill[index] = fill
+        self.changed.add(index)
+        scheduler.invalidate()
+
+    def color(self, index: int, now: float) -> Color:
+        target = self.palette[self.fill[index]]
+        fade = self.fading.get(index)
+        if fade is None:
+            return target
+
+        origin, start, duration = fade
+        if now < start:
+            return origin
+        if duration <= 0 or now >= start + duration:
+            return target
+        return origin.interpolate(target, self.easing((now - start) / duration))
+
+    def instance_at(self, e: Event) -> int | None:
+        """Index of the instance under the pointer when e was delivered."""
+        id = self.canvas.current_item(e)  # type: ignore
+        return None if id is None else self.indexes.get(id)
+
+    def create(self, canvas: Canvas):
+        self.canvas = canvas
+        self.created = True
+        self.create_items()
+
+        handlers: list[tuple[str, Callable]] = []
+        if self.on_enter is not None or self.on_leave is not None:
+            handlers += [("<Enter>", self.enter), ("<Leave>", self.leave)]
+        if self.on_click is not None:
+            handlers.append(("<Button-1>", self.click))
+        for sequence, handler in handlers:
+            funcid = canvas.tag_bind(self.group, sequence, handler, add="+")
+            self.bindings.append((sequence, funcid))
+
+        for component in self.components:
+            component.create(self)
+
+    def create_items(self):
+        tags = [self.tag] if self.tag is not None else []
+        self.canvas.begin_create((*self.groups, self.group))  # type: ignore
+        for _ in range(len(self.ids), len(self.x)):
+            if self.shape == "line":
+                id = self.canvas.create_line(
+                    0, 0, 0, 0, tags=tags, width=self.line_width
+                )
+            else:
+                id = self.canvas.create_rectangle(
+                    0,
+                    0,
+                    0,
+                    0,
+                    tags=tags,
+                    outline=self.outline.to_hex(),
+                    width=self.line_width,
+                )
+            self.indexes[id] = len(self.ids)
+            self.ids.append(id)
+        self.canvas.end_create()  # type: ignore
+
+    def destroy(self):
+        for component in self.components:
+            component.destroy(self)
+        for sequence, funcid in self.bindings:
+            self.canvas.tag_unbind(self.group, sequence, funcid)
+        self.delete_group()
+        self.created = False
+        self.ids = []
+        self.indexes = {}
+        self.bindings = []
+        self.hovered = None
+        self.all_changed = True
+
+    def enter(self, e: Event):
+        index = self.instance_at(e)
+        if index == self.hovered:
+            return
+        self.leave(e)
+        self.hovered = index
+        if index is not None and self.on_enter is not None:
+            self.on_enter(e, index)
+
+    def leave(self, e: Event):
+        index = self.hovered
+        self.hovered = None
+        if index is not None and self.on_leave is not None:
+            self.on_leave(e, index)
+
+    def click(self, e: Event):
+        index = self.instance_at(e)
+        if index is not None and self.on_click is not None:
+            self.on_click(e, index)
+
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        pos = position.copy()
+        size = self._size.copy()
+        self.components.before_paint(self, ctx, pos, size, None)
+
+        self.place_group(pos)
+        tag_raise = self.canvas.tag_raise
+        for id in self.ids:
+            tag_raise(id)
+
+        if self.culled(ctx, pos, size):
+            return pos
+
+        now = clock.now()
+        ids = self.ids
+        coords = self.canvas.coords
+        itemconfigure = self.canvas.itemconfigure
+        changed = range(len(ids)) if self.all_changed else self.changed
+        self.all_changed = False
+        self.changed = set()
+        ox, oy = pos.x, pos.y
+        for i in changed:
+            x = ox + self.x[i]
+            y = oy + self.y[i]
+            coords(ids[i], x, y, x + self.width[i], y + self.height[i])
+            if i not in self.fading:
+                itemconfigure(ids[i], fill=self.palette[self.fill[i]].to_hex())
+
+        for i, (_, start, duration) in list(self.fading.items()):
+            itemconfigure(ids[i], fill=self.color(i, now).to_hex())
+            if now >= start + duration:
+                del self.fading[i]
+            else:
+                scheduler.invalidate()
+
+        return pos
+
+    def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
+        self.components.before_layout(self, ctx, None)
+
+        if self.extent is None:
+            self.extent = Size(
+                width=max(map(add, self.x, self.width), default=0),
+                height=max(map(add, self.y, self.height), default=0),
+            )
+        return constraints.fit_size(self.extent)
@@ -5,6 +5,7 @@ from enum import StrEnum
 from engine.entities.components.base import Component
 from engine.models import FrameContext, Size, Constraints, Position, EdgeInset
 from engine.entities.basic import Entity
+from engine.entities.state import overlay_state
 from engine.threed.entities.basic import Entity3d
 from engine.threed.models import Camera, Position3d, Quaternion
 
@@ -26,15 +27,18 @@ class ScreenSizeLayout(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child.create(canvas)
+        self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
         self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
-        self.child.paint(ctx, position)
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        return position
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         constraints = Constraints(
@@ -44,12 +48,14 @@ class ScreenSizeLayout(Entity):
             max_height=ctx.height,
         )
 
-        self.child._size = self.child.layout(ctx, constraints)
+        self.child._size = self.child.measure(ctx, constraints)
 
         return Size(width=ctx.width, height=ctx.height)
 
 
 class PaddingState:
+    __slots__ = ("padding",)
+
     def __init__(self, padding: EdgeInset):
         self.padding = padding
 
@@ -69,7 +75,7 @@ class Padding(Entity):
         super().__init__(tag=tag, components=components)
         self.child = child
         self.state = PaddingState(padding=padding)
-        self._state = self.state.copy()
+        self._state = self.state
         self._size = Size(width=0, height=0)
 
     def create(self, canvas: Canvas):
@@ -78,28 +84,27 @@ class Padding(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child.create(canvas)
+        self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
         self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
 
-        child_position = Position(
-            x=pos.x + self._state.padding.left, y=pos.y + self._state.padding.top
-        )
-        self.child.paint(ctx, child_position)
+        return Position(x=pos.x + state.padding.left, y=pos.y + state.padding.top)
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
         self._state = state
 
         c = constraints.copy()
@@ -111,7 +116,7 @@ class Padding(Entity):
         c.max_width = max(c.max_width - x_padding, 0)
         c.max_height = max(c.max_height - y_padding, 0)
 
-        child_size = self.child.layout(ctx, c)
+        child_size = self.child.measure(ctx, c)
         self.child._size = child_size
 
         return constraints.fit_size(
@@ -138,28 +143,28 @@ class Center(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child.create(canvas)
+        self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
         self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, None)
+        self.components.before_paint(self, ctx, pos, self._size, None)
 
-        child_position = Position(
+        return Position(
             x=pos.x + (self._size.width - self.child._size.width) / 2,
             y=pos.y + (self._size.height - self.child._size.height) / 2,
         )
 
-        self.child.paint(ctx, child_position)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        self.child._size = self.child.layout(ctx, constraints.with_min(0, 0))
+        self.child._size = self.child.measure(ctx, constraints.with_min(0, 0))
 
         return constraints.fit_size(self.child._size)
 
@@ -171,8 +176,10 @@ class Stack(Entity):
         tag: str | None = None,
         components: list[Component] = [],
         children: list[Entity] = [],
+        group: bool = False,
+        frozen: bool = False,
     ):
-        super().__init__(tag=tag, components=components)
+        super().__init__(tag=tag, components=components, group=group, frozen=frozen)
         self.children = children
 
     def create(self, canvas: Canvas):
@@ -182,32 +189,33 @@ class Stack(Entity):
             component.create(self)
 
         for child in self.children:
-            child.create(canvas)
+            self.create_child(child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
+        self.delete_group()
         for child in self.children:
             child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
         size = self._size.copy()
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, size, None)
+        self.components.before_paint(self, ctx, pos, size, None)
+        self.place_group(pos)
+        return pos
 
-        for child in self.children:
-            child.paint(ctx, pos)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(child, 0, 0) for child in self.children]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        for component in self.components:
-            component.before_layout(self, ctx, None)
+        self.components.before_layout(self, ctx, None)
 
         max_w = 0
         max_h = 0
         for child in self.children:
-            child._size = child.layout(ctx, constraints)
+            child._size = child.measure(ctx, constraints)
             max_w = max(max_w, child._size.width)
             max_h = max(max_h, child._size.height)
 
@@ -221,8 +229,10 @@ class Scene(Entity):
         tag: str | None = None,
         components: list[Component] = [],
         children: list[Entity] = [],
+        group: bool = False,
+        frozen: bool = False,
     ):
-        super().__init__(tag=tag, components=components)
+        super().__init__(tag=tag, components=components, group=group, frozen=frozen)
         self.children = children
 
     def create(self, canvas: Canvas):
@@ -232,30 +242,32 @@ class Scene(Entity):
             component.create(self)
 
         for child in self.children:
-            child.create(canvas)
+            self.create_child(child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
+        self.delete_group()
         for child in self.children:
             child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
         size = self._size.copy()
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, size, None)
+        self.components.before_paint(self, ctx, pos, size, None)
+        self.place_group(pos)
+        return pos
 
-        for child in self.children:
-            child.paint(ctx, pos)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(child, 0, 0) for child in self.children]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         c = constraints.with_min(0, 0)
         max_w = 0
         max_h = 0
         for child in self.children:
-            child_size = child.layout(ctx, c)
+            child_size = child.measure(ctx, c)
             child._size = child_size
             max_w = max(max_w, child_size.width)
             max_h = max(max_h, child_size.height)
@@ -263,6 +275,130 @@ class Scene(Entity):
         return constraints.fit_size(Size(width=max_w, height=max_h))
 
 
+class GridCell:
+    def __init__(
+        self,
+        *,
+        x: int,
+        y: int,
+        child: Entity,
+        width: int = 1,
+        height: int = 1,
+        outset: float = 0,
+    ):
+        self.x = x
+        self.y = y
+        self.child = child
+        self.width = width
+        self.height = height
+        self.outset = outset
+
+
+class Grid(Entity):
+    """
+    Places children on cells of cell_size. A cell spans width x height cells
+    from (x, y), grown by outset on every side, and its child is laid out to
+    fill it. Cells can be anywhere, including negative coordinates; the
+    grid's size covers the cells right and below its origin. Cell offsets
+    and constraints are only worked out again when cells are added or
+    removed.
+    """
+
+    def __init__(
+        self,
+        *,
+        tag: str | None = None,
+        cell_size: float,
+        cells: list[GridCell] = [],
+        components: list[Component] = [],
+        group: bool = False,
+        frozen: bool = False,
+    ):
+        super().__init__(tag=tag, components=components, group=group, frozen=frozen)
+        self.cell_size = cell_size
+        self.cells = list(cells)
+        self.offsets: list[tuple[float, float]] = []
+        self.cell_constraints: list[Constraints] = []
+        self.extent = Size(width=0, height=0)
+        self.cells_dirty = True
+
+    def create(self, canvas: Canvas):
+        self.canvas = canvas
+
+        for component in self.components:
+            component.create(self)
+
+        for cell in self.cells:
+            self.create_child(cell.child, canvas)
+
+    def destroy(self):
+        for component in self.components:
+            component.destroy(self)
+        self.delete_group()
+        for cell in self.cells:
+            cell.child.destroy()
+
+    def add(self, cell: GridCell):
+        self.cells.append(cell)
+        if hasattr(self, "canvas"):
+            self.create_child(cell.child, self.canvas)
+        self.cells_dirty = True
+        self.invalidate()
+
+    def remove(self, cell: GridCell):
+        self.cells.remove(cell)
+        if hasattr(self, "canvas"):
+            cell.child.destroy()
+        self.cells_dirty = True
+        self.invalidate()
+
+    def place_cells(self):
+        self.offsets = []
+        self.cell_constraints = []
+        right = 0.0
+        bottom = 0.0
+        for cell in self.cells:
+            x = cell.x * self.cell_size - cell.outset
+            y = cell.y * self.cell_size - cell.outset
+            width = cell.width * self.cell_size + cell.outset * 2
+            height = cell.height * self.cell_size + cell.outset * 2
+            self.offsets.append((x, y))
+            self.cell_constraints.append(
+                Constraints(
+                    min_width=width,
+                    min_height=height,
+                    max_width=width,
+                    max_height=height,
+                )
+            )
+            right = max(right, x + width)
+            bottom = max(bottom, y + height)
+
+        self.extent = Size(width=right, height=bottom)
+        self.cells_dirty = False
+
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
+        pos = position.copy()
+
+        self.components.before_paint(self, ctx, pos, self._size, None)
+        self.place_group(pos)
+        return pos
+
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(cell.child, x, y) for cell, (x, y) in zip(self.cells, self.offsets)]
+
+    def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
+        self.components.before_layout(self, ctx, None)
+
+        if self.cells_dirty:
+            self.place_cells()
+
+        for cell, c in zip(self.cells, self.cell_constraints):
+            cell.child._size = cell.child.measure(ctx, c)
+
+        return constraints.fit_size(self.extent)
+
+
 class FlexDirection(StrEnum):
     Row = "Row"
     Column = "Column"
@@ -284,6 +420,8 @@ class Alignment(StrEnum):
 
 
 class FlexState:
+    __slots__ = ("direction", "align", "gap")
+
     def __init__(self, *, direction: FlexDirection, align: Alignment, gap: float):
         self.direction = direction
         self.align = align
@@ -305,11 +443,13 @@ class Flex(Entity):
         gap: float = 0,
         components: list[Component] = [],
         children: list[Entity] = [],
+        group: bool = False,
+        frozen: bool = False,
     ):
-        super().__init__(tag=tag, components=components)
+        super().__init__(tag=tag, components=components, group=group, frozen=frozen)
         self.children = children
         self.state = FlexState(direction=direction, align=align, gap=gap)
-        self._state = self.state.copy()
+        self._state = self.state
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -318,116 +458,119 @@ class Flex(Entity):
             component.create(self)
 
         for child in self.children:
-            child.create(canvas)
+            self.create_child(child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
+        self.delete_group()
         for child in self.children:
             child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+        self.place_group(pos)
+        return pos
 
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        state = self._state
+        children = []
+        main = 0.0
         for child in self.children:
-            p = pos.copy()
-            if self._state.direction == FlexDirection.Row:
-                if self._state.align == Alignment.End:
-                    p.y += self._size.height - child._size.height
-                elif self._state.align == Alignment.Center:
-                    p.y += (self._size.height - child._size.height) / 2
-                child.paint(ctx, p)
-                pos.x += child._size.width
-                pos.x += self._state.gap
+            cross = 0.0
+            if state.direction == FlexDirection.Row:
+                if state.align == Alignment.End:
+                    cross = self._size.height - child._size.height
+                elif state.align == Alignment.Center:
+                    cross = (self._size.height - child._size.height) / 2
+                children.append((child, main, cross))
+                main += child._size.width
             else:
-                if self._state.align == Alignment.End:
-                    p.x += self._size.width - child._size.width
-                elif self._state.align == Alignment.Center:
-                    p.x += (self._size.width - child._size.width) / 2
-                child.paint(ctx, p)
-                pos.y += child._size.height
-                pos.y += self._state.gap
+                if state.align == Alignment.End:
+                    cross = self._size.width - child._size.width
+                elif state.align == Alignment.Center:
+                    cross = (self._size.width - child._size.width) / 2
+                children.append((child, cross, main))
+                main += child._size.height
+            main += state.gap
 
-    def is_flex_child(self, child: Entity) -> bool:
-        return hasattr(child, "state") and hasattr(child.state, "flex") and child.state.flex != 0  # type: ignore
+        return children
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
 
         specific_children_size = 0
-        flex_total = 0
         max_cross = 0
-        orig_c = constraints.copy()
+        flex = [child.flex_factor() for child in self.children]
+        flex_total = sum(flex)
+        row = state.direction == FlexDirection.Row
 
-        if state.direction == FlexDirection.Row:
+        c = constraints.copy()
+        if row:
             if state.align != Alignment.Stretch:
-                constraints.min_height = 0
+                c.min_height = 0
             else:
-                constraints.min_height = constraints.max_height
-            constraints.min_width = 0
+                c.min_height = c.max_height
+            c.min_width = 0
         else:
             if state.align != Alignment.Stretch:
-                constraints.min_width = 0
+                c.min_width = 0
             else:
-                constraints.min_width = constraints.max_width
-            constraints.min_height = 0
+                c.min_width = c.max_width
+            c.min_height = 0
 
-        for child in self.children:
-            if self.is_flex_child(child):
-                flex_total += child.state.flex  # type: ignore
+        for child, child_flex in zip(self.children, flex):
+            if child_flex != 0:
                 continue
 
-            c = constraints.copy()
-
-            if state.direction == FlexDirection.Row:
-                child._size = child.layout(ctx, c)
+            child._size = child.measure(ctx, c)
+            if row:
                 specific_children_size += child._size.width
                 max_cross = max(max_cross, child._size.height)
             else:
-                child._size = child.layout(ctx, c)
                 specific_children_size += child._size.height
                 max_cross = max(max_cross, child._size.width)
 
         specific_children_size += state.gap * (len(self.children) - 1)
 
-        if state.direction == FlexDirection.Row:
-            rest = constraints.max_width - specific_children_size
+        if row:
+            rest = c.max_width - specific_children_size
         else:
-            rest = constraints.max_height - specific_children_size
+            rest = c.max_height - specific_children_size
 
         main_size = specific_children_size
 
-        for child in self.children:
-            if not self.is_flex_child(child):  # type: ignore
+        for child, child_flex in zip(self.children, flex):
+            if child_flex == 0:
                 continue
 
-            c = constraints.copy()
-
-            if state.direction == FlexDirection.Row:
-                c.max_width = rest * child.state.flex / flex_total  # type: ignore
-                c.min_width = c.max_width
-                child._size = child.layout(ctx, c)
-                main_size = constraints.max_width
+            child_c = c.copy()
+            if row:
+                child_c.max_width = rest * child_flex / flex_total
+                child_c.min_width = child_c.max_width
+                child._size = child.measure(ctx, child_c)
+                main_size = c.max_width
                 max_cross = max(max_cross, child._size.height)
             else:
-                c.max_height = rest * child.state.flex / flex_total  # type: ignore
-                c.min_height = c.max_height
-                child._size = child.layout(ctx, c)
-                main_size = constraints.max_height
+                child_c.max_height = rest * child_flex / flex_total
+                child_c.min_height = child_c.max_height
+                child._size = child.measure(ctx, child_c)
+                main_size = c.max_height
                 max_cross = max(max_cross, child._size.width)
 
-        if state.direction == FlexDirection.Row:
-            return orig_c.fit_size(Size(width=main_size, height=max_cross))
+        if row:
+            return constraints.fit_size(Size(width=main_size, height=max_cross))
         else:
-            return orig_c.fit_size(Size(width=max_cross, height=main_size))
+            return constraints.fit_size(Size(width=max_cross, height=main_size))
 
 
 class ExpandState:
+    __slots__ = ("flex",)
+
     def __init__(self, *, flex: int):
         self.flex = flex
 
@@ -455,7 +598,7 @@ class Expanded(Entity):
             component.create(self)
 
         if self.child is not None:
-            self.child.create(canvas)
+            self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
@@ -463,18 +606,21 @@ class Expanded(Entity):
         if self.child is not None:
             self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, None)
+        self.components.before_paint(self, ctx, pos, self._size, None)
+        return pos
 
-        if self.child is not None:
-            self.child.paint(ctx, pos)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [] if self.child is None else [(self.child, 0, 0)]
+
+    def flex_factor(self) -> int:
+        return self.state.flex
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         if self.child is not None:
-            self.child._size = self.child.layout(ctx, constraints)
+            self.child._size = self.child.measure(ctx, constraints)
             return constraints.fit_size(self.child._size)
 
         return constraints.to_min_size()
@@ -510,11 +656,10 @@ class Viewport3d(Entity):
         for child in self.children:
             child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, None)
+        self.components.before_paint(self, ctx, pos, self._size, None)
 
         pos3d = Position3d(x=pos.x, y=pos.y, z=0)
 
@@ -522,11 +667,15 @@ class Viewport3d(Entity):
         for child in self.children:
             child.paint(ctx, self.camera, pos3d, Quaternion.identity())
 
+        return pos
+
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
         return constraints.to_max_size()
 
 
 class SizeBoxState:
+    __slots__ = ("width", "height")
+
     def __init__(self, *, width: float | None, height: float | None):
         self.width = width
         self.height = height
@@ -550,7 +699,7 @@ class SizeBox(Entity):
         super().__init__(tag=tag, components=components)
         self.child = child
         self.state = SizeBoxState(width=width, height=height)
-        self._state = self.state.copy()
+        self._state = self.state
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -558,26 +707,26 @@ class SizeBox(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child.create(canvas)
+        self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
         self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+        return pos
 
-        child_position = Position(x=pos.x, y=pos.y)
-        self.child.paint(ctx, child_position)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
         self._state = state
 
         c = constraints.copy()
@@ -588,7 +737,7 @@ class SizeBox(Entity):
             c.min_height = state.height
             c.max_height = state.height
 
-        child_size = self.child.layout(ctx, c)
+        child_size = self.child.measure(ctx, c)
         self.child._size = child_size
 
         w = state.width or child_size.width
@@ -598,6 +747,8 @@ class SizeBox(Entity):
 
 
 class LockMinBoxState:
+    __slots__ = ("width", "height")
+
     def __init__(self, *, width: bool = False, height: bool = False):
         self.width = width
         self.height = height
@@ -621,7 +772,7 @@ class LockMinBox(Entity):
         super().__init__(tag=tag, components=components)
         self.child = child
         self.state = LockMinBoxState(width=width, height=height)
-        self._state = self.state.copy()
+        self._state = self.state
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -629,26 +780,26 @@ class LockMinBox(Entity):
         for component in self.components:
             component.create(self)
 
-        self.child.create(canvas)
+        self.create_child(self.child, canvas)
 
     def destroy(self):
         for component in self.components:
             component.destroy(self)
         self.child.destroy()
 
-    def paint(self, ctx: FrameContext, position: Position):
+    def paint(self, ctx: FrameContext, position: Position) -> Position:
         pos = position.copy()
+        state = overlay_state(self._state, self.components.painters)
 
-        for component in self.components:
-            component.before_paint(self, ctx, pos, self._size, self._state)
+        self.components.before_paint(self, ctx, pos, self._size, state)
+        return pos
 
-        child_position = Position(x=pos.x, y=pos.y)
-        self.child.paint(ctx, child_position)
+    def paint_children(self) -> list[tuple[Entity, float, float]]:
+        return [(self.child, 0, 0)]
 
     def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        state = self.state.copy()
-        for component in self.components:
-            component.before_layout(self, ctx, state)
+        state = overlay_state(self.state, self.components.layouters)
+        self.components.before_layout(self, ctx, state)
         self._state = state
 
         c = constraints.copy()
@@ -657,7 +808,7 @@ class LockMinBox(Entity):
         if state.height:
             c.max_height = c.min_height
 
-        child_size = self.child.layout(ctx, c)
+        child_size = self.child.measure(ctx, c)
         self.child._size = child_size
 
         return constraints.fit_size(child_size)
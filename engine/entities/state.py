@@ -1,13 +1,106 @@
+from __future__ import annotations
+from typing import Any, Protocol
+
+from engine.entities.types import BoundValue
+from engine.metrics import metrics
+from engine.scheduler import scheduler
+from engine.signals import Source
+
+
+class Invalidatable(Protocol):
+    def invalidate(self) -> None: ...
+
+
 class EntityState:
+    """
+    Fields bound through bind() are refreshed by update(). Plain callables
+    are polled, signals and computed values are only read again after they
+    notified a change, which also invalidates the owning entity.
+    """
+
+    _polled: tuple[tuple[str, BoundValue[Any]], ...] = ()
+    _sourced: tuple[tuple[str, BoundValue[Any]], ...] = ()
+    _source_changed = False
+    _owner: Invalidatable | None = None
+
+    def bind(self, field: str, bound: BoundValue[Any]):
+        binding = (field, bound)
+        if isinstance(bound, Source):
+            bound.subscribe(self)
+            self._sourced = (*self._sourced, binding)
+        else:
+            self._polled = (*self._polled, binding)
+
+        setattr(self, field, bound())
+
+    def attach(self, owner: Invalidatable):
+        self._owner = owner
+
+    def source_changed(self):
+        self._source_changed = True
+        scheduler.invalidate()
+        if self._owner is not None:
+            self._owner.invalidate()
+
+    def polled(self) -> bool:
+        return len(self._polled) > 0
+
+    def stale(self) -> bool:
+        if self._source_changed:
+            return True
+
+        for field, bound in self._polled:
+            if bound() != getattr(self, field):
+                return True
+
+        return False
+
     def update(self) -> list[str]:
+        bindings = self._polled
+        if self._source_changed:
+            self._source_changed = False
+            bindings = bindings + self._sourced
+
         changed = []
-        for name, value in vars(self).items():
-            if name.startswith("_bound_"):
-                new_value = value()
-                field_name = name[7:]
-                c = new_value != getattr(self, field_name)
-                if c:
-                    changed.append(field_name)
-                setattr(self, field_name, value())
+        for field, bound in bindings:
+            value = bound()
+            if value != getattr(self, field):
+                changed.append(field)
+            setattr(self, field, value)
 
         return changed
+
+
+class StateOverlay:
+    """
+    Copy-on-write view of a state: attributes set on the overlay stay in it,
+    everything else is read from the base state.
+    """
+
+    def __init__(self, base: Any):
+        self._base = base
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_base":
+            raise AttributeError(name)
+        return getattr(self._base, name)
+
+    def copy(self):
+        return StateOverlay(self)
+
+    def __repr__(self):
+        overrides = {k: v for k, v in self.__dict__.items() if k != "_base"}
+        return f"StateOverlay({self._base!r}, {overrides})"
+
+
+def overlay_state[T](state: T, components: list[Any]) -> T:
+    """
+    The state handed to components for one layout or paint. Entities without
+    components on that hook read their state directly.
+    """
+    if len(components) == 0:
+        metrics.state_copies_skipped += 1
+        return state
+
+    metrics.state_overlays += 1
+    return StateOverlay(state)  # type: ignore
@@ -0,0 +1,12 @@
+from typing import Any
+from tkinter import font
+
+from engine.headless import HeadlessFont
+
+headless = False
+
+
+def Font(**options: Any) -> font.Font:
+    if headless:
+        return HeadlessFont(**options)  # type: ignore
+    return font.Font(**options)
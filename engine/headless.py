@@ -0,0 +1,428 @@
+from __future__ import annotations
+from collections import Counter
+from tkinter import Event
+from typing import Any, Callable
+
+
+class HeadlessFont:
+    def __init__(
+        self,
+        *,
+        family: str = "Helvetica",
+        size: int = 12,
+        weight: str = "normal",
+        slant: str = "roman",
+        **options: Any,
+    ):
+        self.options = dict(
+            family=family, size=size, weight=weight, slant=slant, **options
+        )
+
+    def char_width(self) -> float:
+        width = abs(self.options["size"]) * 0.6
+        if self.options["weight"] == "bold":
+            width *= 1.1
+        return width
+
+    def measure(self, text: str, displayof: Any = None) -> int:
+        lines = str(text).split("\n")
+        return round(max(len(line) for line in lines) * self.char_width())
+
+    def metrics(self, *options: str, **kw: Any):
+        size = abs(self.options["size"])
+        metrics = dict(
+            ascent=round(size * 0.9),
+            descent=round(size * 0.3),
+            linespace=round(size * 1.2),
+            fixed=0,
+        )
+        if len(options) == 1:
+            return metrics[options[0]]
+        return metrics
+
+    def actual(self, option: str | None = None, displayof: Any = None):
+        if option is not None:
+            return self.options[option]
+        return dict(self.options)
+
+    def cget(self, option: str):
+        return self.options[option]
+
+    def configure(self, **options: Any):
+        self.options.update(options)
+
+    config = configure
+
+    def copy(self):
+        return HeadlessFont(**self.options)
+
+    def __str__(self):
+        return (
+            f"{self.options['family']} {self.options['size']} {self.options['weight']}"
+        )
+
+
+class HeadlessImage:
+    counter = 0
+
+    def __init__(self, width: int, height: int):
+        HeadlessImage.counter += 1
+        self.name = f"headless_image{HeadlessImage.counter}"
+        self._width = width
+        self._height = height
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+    def __str__(self):
+        return self.name
+
+
+class HeadlessItem:
+    def __init__(
+        self, id: int, type: str, coords: list[float], options: dict[str, Any]
+    ):
+        self.id = id
+        self.type = type
+        self.coords = coords
+        tags = options.pop("tags", ())
+        self.tags = tags.split() if isinstance(tags, str) else [str(t) for t in tags]
+        self.options = options
+
+
+type Call = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+class HeadlessCanvas:
+    """
+    In-memory stand-in for tkinter.Canvas. Implements the part of the canvas
+    API used by the engine, keeps the item state and stacking order and
+    counts (optionally records) every call made to it.
+    """
+
+    default_font = HeadlessFont(family="Helvetica", size=12)
+
+    def __init__(
+        self,
+        *,
+        width: float = 800,
+        height: float = 600,
+        background: str = "",
+        record: bool = False,
+    ):
+        self.width = width
+        self.height = height
+        self.options: dict[str, Any] = {"background": background, "cursor": ""}
+        self.record = record
+        self.calls: list[Call] = []
+        self.call_counts: Counter[str] = Counter()
+        self.batched_counts: Counter[str] = Counter()
+        self.in_batch = False
+        self.items: dict[int, HeadlessItem] = {}
+        self.stacking: list[int] = []
+        self.current: int | None = None
+        self.bindings: dict[tuple[str, str], dict[str, Callable]] = {}
+        self.widget_bindings: dict[str, dict[str, Callable]] = {}
+        self.idle_tasks: list[Callable[[], Any]] = []
+        self.last_id = 0
+        self.last_funcid = 0
+
+    def _call(self, name: str, args: tuple[Any, ...], kw: dict[str, Any]):
+        if self.in_batch:
+            self.batched_counts[name] += 1
+            return
+        self.call_counts[name] += 1
+        if self.record:
+            self.calls.append((name, args, kw))
+
+    def reset_calls(self):
+        self.calls = []
+        self.call_counts = Counter()
+        self.batched_counts = Counter()
+
+    def eval_batch(self, commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]]):
+        self._call("eval", (commands,), {})
+        self.in_batch = True
+        try:
+            for name, args, options in commands:
+                getattr(self, name)(*args, **options)
+        finally:
+            self.in_batch = False
+
+    def total_calls(self) -> int:
+        return self.call_counts.total()
+
+    def find_withtag(self, tag_or_id: int | str) -> tuple[int, ...]:
+        if isinstance(tag_or_id, int) or str(tag_or_id).isdigit():
+            id = int(tag_or_id)
+            return (id,) if id in self.items else ()
+        if tag_or_id == "all":
+            return tuple(self.stacking)
+        if tag_or_id == "current":
+            return (self.current,) if self.current in self.items else ()
+        return tuple(id for id in self.stacking if tag_or_id in self.items[id].tags)
+
+    def find_all(self) -> tuple[int, ...]:
+        return tuple(self.stacking)
+
+    def _create(self, type: str, args: tuple[Any, ...], options: dict[str, Any]):
+        self._call(f"create_{type}", args, options)
+        self.last_id += 1
+        coords = list(args[0]) if len(args) == 1 else list(args)
+        self.items[self.last_id] = HeadlessItem(
+            self.last_id, type, coords, dict(options)
+        )
+        self.stacking.append(self.last_id)
+        return self.last_id
+
+    def create_rectangle(self, *args: Any, **options: Any) -> int:
+        return self._create("rectangle", args, options)
+
+    def create_oval(self, *args: Any, **options: Any) -> int:
+        return self._create("oval", args, options)
+
+    def create_line(self, *args: Any, **options: Any) -> int:
+        return self._create("line", args, options)
+
+    def create_polygon(self, *args: Any, **options: Any) -> int:
+        return self._create("polygon", args, options)
+
+    def create_text(self, *args: Any, **options: Any) -> int:
+        return self._create("text", args, options)
+
+    def create_image(self, *args: Any, **options: Any) -> int:
+        return self._create("image", args, options)
+
+    def delete(self, *tags_or_ids: int | str):
+        self._call("delete", tags_or_ids, {})
+        for tag_or_id in tags_or_ids:
+            for id in self.find_withtag(tag_or_id):
+                del self.items[id]
+                self.stacking.remove(id)
+
+    def coords(self, tag_or_id: int | str, *args: Any):
+        self._call("coords", (tag_or_id, *args), {})
+        ids = self.find_withtag(tag_or_id)
+        if len(args) == 0:
+            return list(self.items[ids[0]].coords) if ids else []
+        coords = list(args[0]) if len(args) == 1 else list(args)
+        for id in ids:
+            self.items[id].coords = coords
+
+    def move(self, tag_or_id: int | str, dx: float, dy: float):
+        self._call("move", (tag_or_id, dx, dy), {})
+        for id in self.find_withtag(tag_or_id):
+            item = self.items[id]
+            item.coords = [
+                c + (dx if i % 2 == 0 else dy) for i, c in enumerate(item.coords)
+            ]
+
+    def itemconfigure(self, tag_or_id: int | str, **options: Any):
+        self._call("itemconfigure", (tag_or_id,), options)
+        tags = options.pop("tags", None)
+        for id in self.find_withtag(tag_or_id):
+            item = self.items[id]
+            if tags is not None:
+                item.tags = tags.split() if isinstance(tags, str) else list(tags)
+            item.options.update(options)
+
+    itemconfig = itemconfigure
+
+    def itemcget(self, tag_or_id: int | str, option: str):
+        self._call("itemcget", (tag_or_id, option), {})
+        ids = self.find_withtag(tag_or_id)
+        if not ids:
+            return ""
+        return self.items[ids[0]].options.get(option, "")
+
+    def type(self, tag_or_id: int | str) -> str | None:
+        ids = self.find_withtag(tag_or_id)
+        return self.items[ids[0]].type if ids else None
+
+    def gettags(self, tag_or_id: int | str) -> tuple[str, ...]:
+        ids = self.find_withtag(tag_or_id)
+        return tuple(self.items[ids[0]].tags) if ids else ()
+
+    def addtag_withtag(self, new_tag: str, tag_or_id: int | str):
+        self._call("addtag_withtag", (new_tag, tag_or_id), {})
+        for id in self.find_withtag(tag_or_id):
+            if new_tag not in self.items[id].tags:
+                self.items[id].tags.append(new_tag)
+
+    def dtag(self, tag_or_id: int | str, tag_to_delete: str | None = None):
+        self._call("dtag", (tag_or_id, tag_to_delete), {})
+        tag = tag_to_delete if tag_to_delete is not None else str(tag_or_id)
+        for id in self.find_withtag(tag_or_id):
+            if tag in self.items[id].tags:
+                self.items[id].tags.remove(tag)
+
+    def tag_raise(self, tag_or_id: int | str, above: int | str | None = None):
+        self._call(
+            "tag_raise", (tag_or_id,) if above is None else (tag_or_id, above), {}
+        )
+        ids = self.find_withtag(tag_or_id)
+        if not ids:
+            return
+        rest = [id for id in self.stacking if id not in ids]
+        if above is None:
+            self.stacking = rest + list(ids)
+            return
+        target = self.find_withtag(above)
+        idx = rest.index(target[-1]) + 1 if target else len(rest)
+        self.stacking = rest[:idx] + list(ids) + rest[idx:]
+
+    lift = tag_raise
+
+    def tag_lower(self, tag_or_id: int | str, below: int | str | None = None):
+        self._call(
+            "tag_lower", (tag_or_id,) if below is None else (tag_or_id, below), {}
+        )
+        ids = self.find_withtag(tag_or_id)
+        if not ids:
+            return
+        rest = [id for id in self.stacking if id not in ids]
+        if below is None:
+            self.stacking = list(ids) + rest
+            return
+        target = self.find_withtag(below)
+        idx = rest.index(target[0]) if target else 0
+        self.stacking = rest[:idx] + list(ids) + rest[idx:]
+
+    def _item_bbox(self, item: HeadlessItem) -> tuple[int, int, int, int] | None:
+        if item.options.get("state") == "hidden" or len(item.coords) < 2:
+            return None
+
+        x, y = item.coords[0], item.coords[1]
+        if item.type == "text":
+            font = item.options.get("font")
+            if not isinstance(font, HeadlessFont):
+                font = self.default_font
+            text = str(item.options.get("text", ""))
+            wrap = item.options.get("width", 0) or 0
+            lines = []
+            for line in text.split("\n"):
+                chars = max(int(float(wrap) // font.char_width()), 1) if wrap else 0
+                while chars and len(line) > chars:
+                    lines.append(line[:chars])
+                    line = line[chars:]
+                lines.append(line)
+            w = font.measure("\n".join(lines))
+            h = font.metrics("linespace") * len(lines)
+            return (round(x), round(y), round(x + w), round(y + h))
+
+        if item.type == "image":
+            image = item.options.get("image")
+            if not image:
+                return None
+            w, h = image.width(), image.height()
+            return (round(x), round(y), round(x + w), round(y + h))
+
+        xs = [float(c) for c in item.coords[0::2]]
+        ys = [float(c) for c in item.coords[1::2]]
+        return (
+            round(min(xs)) - 1,
+            round(min(ys)) - 1,
+            round(max(xs)) + 1,
+            round(max(ys)) + 1,
+        )
+
+    def bbox(self, *tags_or_ids: int | str) -> tuple[int, int, int, int] | None:
+        self._call("bbox", tags_or_ids, {})
+        boxes = []
+        for tag_or_id in tags_or_ids:
+            for id in self.find_withtag(tag_or_id):
+                box = self._item_bbox(self.items[id])
+                if box is not None:
+                    boxes.append(box)
+        if not boxes:
+            return None
+        return (
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            max(b[2] for b in boxes),
+            max(b[3] for b in boxes),
+        )
+
+    def tag_bind(
+        self,
+        tag_or_id: int | str,
+        sequence: str,
+        func: Callable,
+        add: str | bool | None = None,
+    ) -> str:
+        self._call("tag_bind", (tag_or_id, sequence), {})
+        self.last_funcid += 1
+        funcid = f"headless_bind{self.last_funcid}"
+        handlers = self.bindings.setdefault((str(tag_or_id), sequence), {})
+        if not add:
+            handlers.clear()
+        handlers[funcid] = func
+        return funcid
+
+    def tag_unbind(
+        self, tag_or_id: int | str, sequence: str, funcid: str | None = None
+    ):
+        self._call("tag_unbind", (tag_or_id, sequence), {})
+        handlers = self.bindings.get((str(tag_or_id), sequence), {})
+        if funcid is None:
+            handlers.clear()
+        else:
+            handlers.pop(funcid, None)
+
+    def bind(self, sequence: str, func: Callable, add: str | bool | None = None) -> str:
+        self.last_funcid += 1
+        funcid = f"headless_bind{self.last_funcid}"
+        handlers = self.widget_bindings.setdefault(sequence, {})
+        if not add:
+            handlers.clear()
+        handlers[funcid] = func
+        return funcid
+
+    def unbind(self, sequence: str, funcid: str | None = None):
+        handlers = self.widget_bindings.get(sequence, {})
+        if funcid is None:
+            handlers.clear()
+        else:
+            handlers.pop(funcid, None)
+
+    def configure(self, **options: Any):
+        self._call("configure", (), options)
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, option: str):
+        return self.options.get(option, "")
+
+    def resize(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        event = Event()
+        event.width = int(width)
+        event.height = int(height)
+        for handler in list(self.widget_bindings.get("<Configure>", {}).values()):
+            handler(event)
+
+    def winfo_width(self) -> int:
+        return int(self.width)
+
+    def winfo_height(self) -> int:
+        return int(self.height)
+
+    def after_idle(self, func: Callable, *args: Any) -> str:
+        self.idle_tasks.append(lambda: func(*args))
+        return f"after#{len(self.idle_tasks)}"
+
+    def after(self, ms: int, func: Callable | None = None, *args: Any) -> str:
+        if func is None:
+            return ""
+        return self.after_idle(func, *args)
+
+    def run_idle_tasks(self):
+        tasks = self.idle_tasks
+        self.idle_tasks = []
+        for task in tasks:
+            task()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+
+
+class FrameMetrics:
+    """
+    Counters collected during a frame. The renderer sums them over its
+    metrics interval with add(), so a counter only needs a line in reset().
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.canvas_calls_issued = 0
+        self.canvas_calls_skipped = 0
+        self.tcl_evaluations = 0
+        self.canvas_time = 0.0
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+        self.state_overlays = 0
+        self.state_copies_skipped = 0
+        self.item_pool_hits = 0
+        self.item_pool_misses = 0
+
+    def add(self, other: FrameMetrics):
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+class FramePhases:
+    """
+    Smoothed per-frame time spent in each phase: layout and paint count only
+    the Python side, canvas is the time spent inside canvas calls and idle
+    is the gap between the end of one frame and the start of the next.
+    """
+
+    def __init__(self, smoothing: float = 0.1):
+        self.smoothing = smoothing
+        self.layout = 0.0
+        self.paint = 0.0
+        self.canvas = 0.0
+        self.idle = 0.0
+
+    def add(self, *, layout: float, paint: float, canvas: float, idle: float):
+        self.layout += (layout - self.layout) * self.smoothing
+        self.paint += (paint - self.paint) * self.smoothing
+        self.canvas += (canvas - self.canvas) * self.smoothing
+        self.idle += (idle - self.idle) * self.smoothing
+
+    def __str__(self):
+        return (
+            f"layout {self.layout * 1000:.2f} ms, paint {self.paint * 1000:.2f} ms, "
+            f"canvas {self.canvas * 1000:.2f} ms, idle {self.idle * 1000:.2f} ms"
+        )
+
+
+@dataclass(frozen=True)
+class FrameTimeSummary:
+    frames: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    over_budget: int
+    budget: float
+
+    def __str__(self):
+        return (
+            f"p50 {self.p50 * 1000:.1f} ms, p95 {self.p95 * 1000:.1f} ms, "
+            f"p99 {self.p99 * 1000:.1f} ms, max {self.max * 1000:.1f} ms, "
+            f"{self.over_budget}/{self.frames} over {self.budget * 1000:.1f} ms"
+        )
+
+
+class FrameTimeHistogram:
+    """
+    Rolling window of the last frame times. counts holds a histogram of the
+    window in bucket_size wide buckets, the last bucket collects everything
+    above. total counts every frame ever added and is not reset by clear(),
+    FpsCounter and FrameTimeStats measure their periods with it.
+    """
+
+    def __init__(
+        self, *, window: int = 600, bucket_size: float = 0.001, buckets: int = 50
+    ):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.bucket_size = bucket_size
+        self.counts = [0] * (buckets + 1)
+        self.budget = 1 / 60
+        self.total = 0
+
+    def bucket(self, frame_time: float) -> int:
+        return min(int(frame_time / self.bucket_size), len(self.counts) - 1)
+
+    def add(self, frame_time: float):
+        if len(self.samples) == self.samples.maxlen:
+            self.counts[self.bucket(self.samples[0])] -= 1
+        self.samples.append(frame_time)
+        self.total += 1
+        self.counts[self.bucket(frame_time)] += 1
+
+    def summary(self) -> FrameTimeSummary:
+        ordered = sorted(self.samples)
+        n = len(ordered)
+
+        def at(p: float):
+            return ordered[min(int(n * p / 100), n - 1)] if n > 0 else 0
+
+        return FrameTimeSummary(
+            frames=n,
+            p50=at(50),
+            p95=at(95),
+            p99=at(99),
+            max=ordered[-1] if n > 0 else 0,
+            over_budget=sum(1 for t in ordered if t > self.budget),
+            budget=self.budget,
+        )
+
+    def resize(self, window: int):
+        self.samples = deque(maxlen=max(window, 1))
+        self.clear()
+
+    def clear(self):
+        self.samples.clear()
+        self.counts = [0] * len(self.counts)
+
+
+metrics = FrameMetrics()
+frame_times = FrameTimeHistogram()
+phases = FramePhases()
@@ -1,6 +1,5 @@
 from __future__ import annotations
-import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import colorsys
 
 from engine.assets import AssetManager
@@ -15,11 +14,13 @@ class FrameContext:
         width: float,
         height: float,
         asset_manager: AssetManager,
+        size_changed: bool = False,
     ):
         self.delta_time = delta_time
         self.width = width
         self.height = height
         self.asset_manager = asset_manager
+        self.size_changed = size_changed
 
     def __repr__(self):
         return f"FrameContext(delta_time={self.delta_time})"
@@ -29,6 +30,8 @@ class FrameContext:
 
 
 class Size(Transitionable):
+    __slots__ = ("width", "height")
+
     @staticmethod
     def square(value: float) -> Size:
         return Size(width=value, height=value)
@@ -38,7 +41,7 @@ class Size(Transitionable):
         self.height = height
 
     def copy(self):
-        return copy.copy(self)
+        return Size(width=self.width, height=self.height)
 
     def max(self, other: Size):
         return Size(
@@ -66,6 +69,8 @@ class Size(Transitionable):
 
 
 class Position(Transitionable):
+    __slots__ = ("x", "y")
+
     @staticmethod
     def zero() -> Position:
         return Position(x=0, y=0)
@@ -75,7 +80,7 @@ class Position(Transitionable):
         self.y = y
 
     def copy(self):
-        return copy.copy(self)
+        return Position(x=self.x, y=self.y)
 
     def add(self, other: Position):
         return Position(x=self.x + other.x, y=self.y + other.y)
@@ -110,6 +115,8 @@ class Position(Transitionable):
 
 
 class Constraints:
+    __slots__ = ("min_width", "min_height", "max_width", "max_height")
+
     def __init__(
         self,
         *,
@@ -124,7 +131,12 @@ class Constraints:
         self.max_height = max_height
 
     def copy(self):
-        return copy.copy(self)
+        return Constraints(
+            min_width=self.min_width,
+            min_height=self.min_height,
+            max_width=self.max_width,
+            max_height=self.max_height,
+        )
 
     def fit_width(self, width: float | None):
         if width is None:
@@ -148,7 +160,8 @@ class Constraints:
         if size is None:
             return Size(width=self.min_width, height=self.min_height)
         return Size(
-            width=self.fit_width(size.width), height=self.fit_height(size.height)
+            width=min(self.max_width, max(self.min_width, size.width)),
+            height=min(self.max_height, max(self.min_height, size.height)),
         )
 
     def with_min(self, min_width: float, min_height: float):
@@ -178,24 +191,39 @@ class Constraints:
             max_height=size.height,
         )
 
+    def __eq__(self, other: object):
+        if not isinstance(other, Constraints):
+            return False
+        return (
+            self.min_width == other.min_width
+            and self.min_height == other.min_height
+            and self.max_width == other.max_width
+            and self.max_height == other.max_height
+        )
+
     def __repr__(self):
         return f"Constraints(min_width={self.min_width}, min_height={self.min_height}, max_width={self.max_width}, max_height={self.max_height})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Color(Transitionable):
     r: int
     g: int
     b: int
     _transparent: bool = False
+    _hex: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def copy(self):
-        return copy.copy(self)
+        color = Color(self.r, self.g, self.b, self._transparent)
+        color._hex = self._hex
+        return color
 
     def to_hex(self) -> str:
-        if self._transparent:
-            return ""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        if self._hex is None:
+            self._hex = (
+                "" if self._transparent else f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+            )
+        return self._hex
 
     def to_hls(self) -> tuple[float, float, float]:
         return colorsys.rgb_to_hls(self.r / 255.0, self.g / 255.0, self.b / 255.0)
@@ -263,6 +291,8 @@ class Color(Transitionable):
 
 
 class EdgeInset:
+    __slots__ = ("top", "right", "bottom", "left")
+
     def __init__(self, top: float, right: float, bottom: float, left: float):
         self.top = top
         self.right = right
@@ -288,4 +318,6 @@ class EdgeInset:
         )
 
     def copy(self):
-        return copy.copy(self)
+        return EdgeInset(
+            top=self.top, right=self.right, bottom=self.bottom, left=self.left
+        )
@@ -0,0 +1,62 @@
+from typing import Any
+
+from engine.metrics import metrics
+
+# Options the engine sets on each item type, reset when an item is reused.
+item_defaults: dict[str, dict[str, Any]] = {
+    "rectangle": {"fill": "", "outline": "black", "width": 1.0},
+    "oval": {"fill": "", "outline": "black", "width": 1.0},
+    "line": {"fill": "black", "width": 1.0},
+    "polygon": {"fill": "black", "outline": "", "width": 1.0},
+    "text": {
+        "text": "",
+        "fill": "black",
+        "font": "TkDefaultFont",
+        "width": 0,
+        "justify": "left",
+        "anchor": "center",
+    },
+    "image": {"image": "", "anchor": "center"},
+}
+
+
+class ItemPool:
+    """
+    Hidden canvas items of deleted entities, kept per item type so that
+    creating an item of the same type reuses one instead of allocating a new
+    Tk item. At most size items of each type are kept.
+    """
+
+    def __init__(self, size: int = 512):
+        self.size = size
+        self.free: dict[str, list[int]] = {}
+
+    def take(self, type: str) -> int | None:
+        if type not in item_defaults:
+            return None
+
+        free = self.free.get(type)
+        if not free:
+            metrics.item_pool_misses += 1
+            return None
+
+        metrics.item_pool_hits += 1
+        return free.pop()
+
+    def give(self, type: str, id: int) -> bool:
+        if type not in item_defaults:
+            return False
+
+        free = self.free.setdefault(type, [])
+        if len(free) >= self.size:
+            return False
+
+        free.append(id)
+        return True
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self.free.values())
+
+    def __str__(self) -> str:
+        pooled = [f"{len(ids)} {type}" for type, ids in self.free.items() if ids]
+        return ", ".join(pooled) if pooled else "empty"
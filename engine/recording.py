@@ -0,0 +1,142 @@
+from __future__ import annotations
+import gzip
+import json
+from dataclasses import dataclass
+from tkinter import Event
+from typing import Any, TextIO
+
+from engine.clock import clock
+
+FORMAT_VERSION = 1
+EVENT_FIELDS = ["x", "y", "num", "delta", "keysym", "state", "item"]
+
+
+@dataclass(frozen=True)
+class RecordedFrame:
+    time: float
+    delta_time: float
+    width: float
+    height: float
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    frame: int
+    time: float
+    kind: str
+    tag: str
+    sequence: str
+    fields: dict[str, Any]
+
+    def to_event(self) -> Event:
+        event = Event()
+        for name, value in self.fields.items():
+            setattr(event, name, value)
+        return event
+
+
+class Recorder:
+    """
+    Writes a session to a gzipped file of JSON lines: a header with the
+    random seed and options, one line per rendered frame (clock time,
+    delta_time and canvas size) and one line per input event delivered to
+    a canvas binding, tagged with the number of frames rendered before it.
+    """
+
+    def __init__(self):
+        self.file: TextIO | None = None
+        self.frames = 0
+        self.start_time = 0.0
+        self.last_event: tuple[Any, ...] | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.file is not None
+
+    def start(self, path: str, *, seed: int, options: dict[str, Any] = {}):
+        self.file = gzip.open(path, "wt")
+        self.frames = 0
+        self.start_time = clock.now()
+        self.write(
+            {"version": FORMAT_VERSION, "seed": seed, "options": options},
+        )
+
+    def stop(self):
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+
+    def write(self, line: Any):
+        assert self.file is not None
+        self.file.write(json.dumps(line, separators=(",", ":")))
+        self.file.write("\n")
+
+    def record_frame(self, delta_time: float, width: float, height: float):
+        if self.file is None:
+            return
+        self.write(
+            ["f", clock.now() - self.start_time, delta_time, width, height],
+        )
+        self.frames += 1
+
+    def record_event(self, kind: str, tag: str, sequence: str, e: Event):
+        if self.file is None:
+            return
+
+        # Tk runs every handler bound to the same tag for one event, replay
+        # does the same, so each (event, tag) pair is written once.
+        key = (getattr(e, "serial", None), kind, tag, sequence)
+        if key == self.last_event and key[0] is not None:
+            return
+        self.last_event = key
+
+        fields = {}
+        for name in EVENT_FIELDS:
+            value = getattr(e, name, None)
+            if isinstance(value, (int, float, str)) and value != "??":
+                fields[name] = value
+
+        self.write(
+            [
+                "e",
+                self.frames,
+                clock.now() - self.start_time,
+                kind,
+                tag,
+                sequence,
+                fields,
+            ],
+        )
+
+
+class Replayer:
+    def __init__(self, path: str):
+        self.frames: list[RecordedFrame] = []
+        self.events: dict[int, list[RecordedEvent]] = {}
+
+        with gzip.open(path, "rt") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != FORMAT_VERSION:
+                raise Exception(f"Unsupported recording version in {path}")
+            self.seed: int = header["seed"]
+            self.options: dict[str, Any] = header.get("options", {})
+
+            for line in f:
+                record = json.loads(line)
+                if record[0] == "f":
+                    self.frames.append(RecordedFrame(*record[1:]))
+                elif record[0] == "e":
+                    event = RecordedEvent(*record[1:])
+                    self.events.setdefault(event.frame, []).append(event)
+
+    def events_before(self, frame: int) -> list[RecordedEvent]:
+        return self.events.get(frame, [])
+
+    def duration(self) -> float:
+        if len(self.frames) == 0:
+            return 0
+        return self.frames[-1].time
+
+
+recorder = Recorder()
@@ -1,9 +1,17 @@
 import os
+import time
 from timeit import default_timer as timer
 from tkinter import Tk, Canvas
 
+from engine import fonts
+from engine.canvas import RetainedCanvas
+from engine.clock import clock
 from engine.entities.basic import RootScene
+from engine.headless import HeadlessCanvas
+from engine.metrics import FrameMetrics, metrics as frame_metrics, frame_times, phases
 from engine.models import Color, FrameContext
+from engine.recording import Replayer, recorder
+from engine.scheduler import scheduler
 from engine.assets import AssetManager
 from game.theme_colors import ThemeColors
 from engine.logger import logger
@@ -17,75 +25,266 @@ class Renderer:
         asset_folder: str,
         bg: Color = ThemeColors.fg(),
         metrics: bool = False,
+        headless: bool = False,
+        fps_cap: int = 120,
+        idle_redraw: bool = False,
+        idle_poll: float | None = None,
     ):
         self.log = logger.getChild("Renderer")
         self.scene: RootScene | None = None
-        self.root = Tk()
-        self.root.attributes("-fullscreen", True)
-        self.root.geometry(f"{window_width}x{window_height}")
-        self.canvas = Canvas(self.root, highlightthickness=0, background=bg.to_hex())
-        self.canvas.pack(fill="both", expand=True)
+        self.headless = headless
+        self.root: Tk | None = None
+        self.backend: Canvas
+        if headless:
+            fonts.headless = True
+            self.backend = HeadlessCanvas(  # type: ignore
+                width=window_width, height=window_height, background=bg.to_hex()
+            )
+        else:
+            self.root = Tk()
+            self.root.attributes("-fullscreen", True)
+            self.root.geometry(f"{window_width}x{window_height}")
+            self.backend = Canvas(
+                self.root, highlightthickness=0, background=bg.to_hex()
+            )
+            self.backend.pack(fill="both", expand=True)
+        self.canvas: Canvas = RetainedCanvas(self.backend)  # type: ignore
+        self.width = self.backend.winfo_width()
+        self.height = self.backend.winfo_height()
+        self.last_size = (0, 0)
+        self.backend.bind("<Configure>", self.on_configure, add="+")
         self.last_frame = timer()
-        self.asset_manager = AssetManager(asset_folder)
+        self.last_frame_end: float | None = None
+        self.asset_manager = AssetManager(asset_folder, headless=headless)
 
         self.engine_time = 0
         self.frames = 0
+        self.totals = FrameMetrics()
         self.last_metrics = timer()
         self.metrics = metrics
 
+        scheduler.configure(
+            fps_cap=fps_cap, idle_redraw=idle_redraw, idle_poll=idle_poll
+        )
+        scheduler.on_wake = self.resume
+        frame_times.budget = scheduler.interval() or 1 / 60
+        self.pending_frame: str | None = None
+
     def assign_scene(self, scene: RootScene):
         if self.scene is not None:
             self.scene.destroy()
         self.scene = scene
         self.scene.create(self.canvas)
 
-    def frame(self):
+    def render(self, delta_time: float | None = None):
         if self.scene is None:
             raise Exception("No scene assigned")
 
         now = timer()
-        delta_time = now - self.last_frame
-        if delta_time > 1 / 3:
-            delta_time = 0
+        if delta_time is None:
+            delta_time = now - self.last_frame
+            if delta_time > 1 / 3:
+                delta_time = 0
         self.last_frame = now
+        recorder.record_frame(delta_time, self.width, self.height)
 
+        frame_metrics.reset()
+        size = (self.width, self.height)
         ctx = FrameContext(
             delta_time=delta_time,
-            width=self.canvas.winfo_width(),
-            height=self.canvas.winfo_height(),
+            width=self.width,
+            height=self.height,
             asset_manager=self.asset_manager,
+            size_changed=size != self.last_size,
         )
+        self.last_size = size
+        self.canvas.begin_frame()  # type: ignore
+        layout_start = timer()
+        canvas_time_before_layout = frame_metrics.canvas_time
         self.scene.layout(ctx)
+        layout_end = timer()
+        layout_canvas_time = frame_metrics.canvas_time - canvas_time_before_layout
         self.scene.paint(ctx)
+        self.canvas.flush()  # type: ignore
+
+        new_now = timer()
+        frame_times.add(new_now - now)
+        phases.add(
+            layout=layout_end - layout_start - layout_canvas_time,
+            paint=new_now
+            - layout_end
+            - (
+                frame_metrics.canvas_time
+                - layout_canvas_time
+                - canvas_time_before_layout
+            ),
+            canvas=frame_metrics.canvas_time,
+            idle=now - self.last_frame_end if self.last_frame_end else 0,
+        )
+        self.last_frame_end = new_now
 
         if self.metrics:
-            new_now = timer()
             self.engine_time += new_now - now
             self.frames += 1
+            self.totals.add(frame_metrics)
 
             if new_now - self.last_metrics > 1:
+                totals = self.totals
                 self.log.info(
-                    f"Frames renderred: %d, Engine time: %f ms, Engine frame time: %f ms",
+                    f"Frames renderred: %d, Engine time: %f ms, Engine frame time: %f ms, Canvas calls per frame: %d issued, %d skipped, %.1f Tcl evaluations, Frame jitter: %.2f ms (max %.2f ms)",
                     self.frames,
                     self.engine_time * 1000,
                     self.engine_time * 1000 / self.frames,
+                    totals.canvas_calls_issued / self.frames,
+                    totals.canvas_calls_skipped / self.frames,
+                    totals.tcl_evaluations / self.frames,
+                    scheduler.jitter * 1000,
+                    scheduler.max_jitter * 1000,
+                )
+                self.log.info("Frame times: %s", frame_times.summary())
+                self.log.info("Frame phases: %s", phases)
+                text_lookups = totals.text_cache_hits + totals.text_cache_misses
+                self.log.info(
+                    "Text metrics cache: %d hits, %d misses (%.1f%% hit rate)",
+                    totals.text_cache_hits,
+                    totals.text_cache_misses,
+                    totals.text_cache_hits * 100 / text_lookups if text_lookups else 0,
                 )
+                self.log.info(
+                    "Entity state per frame: %.1f overlays allocated, %.1f copies skipped",
+                    totals.state_overlays / self.frames,
+                    totals.state_copies_skipped / self.frames,
+                )
+                pool_lookups = totals.item_pool_hits + totals.item_pool_misses
+                self.log.info(
+                    "Item pool: %d hits, %d misses (%.1f%% reused), pooled: %s",
+                    totals.item_pool_hits,
+                    totals.item_pool_misses,
+                    totals.item_pool_hits * 100 / pool_lookups if pool_lookups else 0,
+                    self.canvas.pool,  # type: ignore
+                )
+                scheduler.reset_jitter()
                 self.frames = 0
                 self.engine_time = 0
+                totals.reset()
                 self.last_metrics = new_now
 
+    def on_configure(self, e):
+        self.width = e.width
+        self.height = e.height
+
+    def frame(self):
+        self.pending_frame = None
+        scheduler.frame_started(timer())
+
+        self.render()
+        if self.asset_manager.loading:
+            scheduler.wake_in(0.1)
+
+        delay = scheduler.frame_finished(timer(), frame_metrics.canvas_calls_issued > 0)
+        if delay is not None:
+            self.schedule_frame(delay)
+
+    def schedule_frame(self, delay: float):
+        assert self.root is not None
+
         # after_idle does not work on macos
         # https://github.com/python/cpython/issues/100617
-        if os.name == "nt":
-            self.root.after_idle(self.frame)
+        if os.name == "nt" and delay <= 0:
+            self.pending_frame = self.root.after_idle(self.frame)
         else:
-            self.root.after(8, self.frame)
+            self.pending_frame = self.root.after(
+                max(round(delay * 1000), 1), self.frame
+            )
+
+    def wake(self, e=None):
+        scheduler.invalidate()
+
+    def resume(self):
+        if self.root is None:
+            return
+
+        if self.pending_frame is not None:
+            self.root.after_cancel(self.pending_frame)
+        self.schedule_frame(0)
+
+    def run(self, frames: int, delta_time: float | None = None):
+        if not self.headless:
+            raise Exception("run() is only available on a headless renderer")
+
+        assert isinstance(self.backend, HeadlessCanvas)
+        self.last_frame = timer()
+        for _ in range(frames):
+            self.backend.run_idle_tasks()
+            self.render(delta_time)
+
+    def replay(self, replayer: Replayer, paced: bool = False):
+        """
+        Renders the recorded frames with their delta_time and canvas size,
+        dispatching each recorded event to the current handlers before the
+        frame it preceded. The engine clock is pinned to the recorded times.
+        Unpaced replay renders frames back to back.
+        """
+        assert isinstance(self.canvas, RetainedCanvas)
+        canvas = self.canvas
+        start = timer()
+        replay_start = clock.now()
+
+        def replay_frame(i: int):
+            for event in replayer.events_before(i):
+                clock.fixed = replay_start + event.time
+                canvas.dispatch(event.kind, event.tag, event.sequence, event.to_event())
+
+            frame = replayer.frames[i]
+            clock.fixed = replay_start + frame.time
+            self.width = frame.width
+            self.height = frame.height
+            self.render(frame.delta_time)
+            clock.fixed = None
+
+        def delay(i: int) -> float:
+            if not paced:
+                return 0
+            return max(replayer.frames[i].time - (timer() - start), 0)
+
+        if self.root is None:
+            assert isinstance(self.backend, HeadlessCanvas)
+            for i in range(len(replayer.frames)):
+                time.sleep(delay(i))
+                self.backend.run_idle_tasks()
+                replay_frame(i)
+            return
+
+        root = self.root
+
+        def step(i: int):
+            if i >= len(replayer.frames):
+                root.quit()
+                return
+            replay_frame(i)
+            next_delay = delay(i + 1) if i + 1 < len(replayer.frames) else 0
+            root.after(max(round(next_delay * 1000), 1), step, i + 1)
+
+        root.after(1, step, 0)
+        root.mainloop()
 
     def start(self):
+        if self.root is None:
+            raise Exception("Headless renderer has no window, use run() instead")
+
         self.last_frame = timer()
 
         def on_visible(e):
-            self.root.after_idle(self.frame)
+            if self.pending_frame is None:
+                self.schedule_frame(0)
 
         self.root.bind("<Visibility>", on_visible)
+        for sequence in [
+            "<Motion>",
+            "<ButtonPress>",
+            "<ButtonRelease>",
+            "<KeyPress>",
+            "<Configure>",
+        ]:
+            self.root.bind(sequence, self.wake, add="+")
         self.root.mainloop()
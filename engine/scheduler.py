@@ -0,0 +1,82 @@
+from typing import Callable
+
+
+class FrameScheduler:
+    """
+    Decides when the next frame should be rendered. Frames are paced against
+    deadlines derived from the fps cap. With idle_redraw enabled, a frame that
+    changed nothing on the canvas and was not invalidated puts the renderer to
+    sleep until input arrives, something calls invalidate() (signal changes
+    do), or wake_in() asked for a frame. Plain callable BoundValues are only
+    read during frames, so scenes that rely on them while idle should set
+    idle_poll to render a frame at least that often.
+    """
+
+    def __init__(self):
+        self.fps_cap = 120
+        self.idle_redraw = False
+        self.idle_poll: float | None = None
+        self.invalidated = True
+        self.idle = False
+        self.deadline: float | None = None
+        self.wake: float | None = None
+        self.jitter = 0.0
+        self.max_jitter = 0.0
+        self.on_wake: Callable[[], None] | None = None
+
+    def configure(
+        self, *, fps_cap: int, idle_redraw: bool, idle_poll: float | None = None
+    ):
+        self.fps_cap = fps_cap
+        self.idle_redraw = idle_redraw
+        self.idle_poll = idle_poll
+
+    def interval(self) -> float:
+        if self.fps_cap <= 0:
+            return 0
+        return 1 / self.fps_cap
+
+    def invalidate(self):
+        self.invalidated = True
+        if self.idle:
+            self.idle = False
+            if self.on_wake is not None:
+                self.on_wake()
+
+    def wake_in(self, delay: float):
+        """Asks for a frame within delay seconds, even while idle."""
+        if self.wake is None or delay < self.wake:
+            self.wake = delay
+
+    def frame_started(self, now: float):
+        if self.deadline is not None and not self.idle:
+            late = abs(now - self.deadline)
+            self.jitter += (late - self.jitter) * 0.1
+            self.max_jitter = max(self.max_jitter, late)
+        self.idle = False
+
+    def frame_finished(self, now: float, changed: bool) -> float | None:
+        active = changed or self.invalidated
+        self.invalidated = False
+        wake = self.wake
+        self.wake = None
+
+        if self.idle_redraw and not active:
+            self.idle = True
+            self.deadline = None
+            if wake is None or self.idle_poll is None:
+                return wake if self.idle_poll is None else self.idle_poll
+            return min(self.idle_poll, wake)
+
+        interval = self.interval()
+        if self.deadline is None or now - self.deadline > interval:
+            self.deadline = now
+        self.deadline += interval
+
+        return max(self.deadline - now, 0)
+
+    def reset_jitter(self):
+        self.max_jitter = 0.0
+
+
+scheduler = FrameScheduler()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Protocol
+from weakref import WeakSet
+
+
+class Subscriber(Protocol):
+    def source_changed(self) -> None: ...
+
+
+tracking: list[Computed[Any]] = []
+
+
+class Source[T](ABC):
+    """
+    A value that notifies its subscribers when it changes. Sources are
+    callable, so they can be passed anywhere a BoundValue is expected.
+    Subscribers are held weakly.
+    """
+
+    value: T
+
+    def __init__(self):
+        self.subscribers: WeakSet[Subscriber] = WeakSet()
+
+    @abstractmethod
+    def __call__(self) -> T:
+        pass
+
+    def subscribe(self, subscriber: Subscriber):
+        self.subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def notify(self):
+        for subscriber in list(self.subscribers):
+            subscriber.source_changed()
+
+    def track(self):
+        if len(tracking) > 0:
+            tracking[-1].depend(self)
+
+
+class Signal[T](Source[T]):
+    def __init__(self, value: T):
+        super().__init__()
+        self.value = value
+
+    def __call__(self) -> T:
+        self.track()
+        return self.value
+
+    def set(self, value: T):
+        if value == self.value:
+            return
+        self.value = value
+        self.notify()
+
+    def __repr__(self):
+        return f"Signal({self.value!r})"
+
+
+class Computed[T](Source[T]):
+    """
+    A value derived from other sources. Sources read while computing become
+    its dependencies; it is recomputed lazily, on the first read after one of
+    them changed.
+    """
+
+    def __init__(self, compute: Callable[[], T]):
+        super().__init__()
+        self.compute = compute
+        self.dirty = True
+        self.dependencies: list[Source[Any]] = []
+
+    def __call__(self) -> T:
+        self.track()
+        if self.dirty:
+            for dependency in self.dependencies:
+                dependency.unsubscribe(self)
+            self.dependencies = []
+
+            tracking.append(self)
+            try:
+                self.value = self.compute()
+            finally:
+                tracking.pop()
+            self.dirty = False
+
+        return self.value
+
+    def depend(self, source: Source[Any]):
+        if source not in self.dependencies:
+            self.dependencies.append(source)
+            source.subscribe(self)
+
+    def source_changed(self):
+        if self.dirty:
+            return
+        self.dirty = True
+        self.notify()
+
+    def __repr__(self):
+        return f"Computed({self.compute!r})"
@@ -0,0 +1,182 @@
+from bisect import bisect_left
+from itertools import islice
+from typing import Any, Iterable
+
+type StackOp = tuple[str, tuple[Any, ...]]
+
+
+def longest_increasing(values: list[int]) -> set[int]:
+    """Indices of one longest strictly increasing subsequence of values."""
+    tails: list[int] = []
+    tail_indices: list[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        at = bisect_left(tails, value)
+        if at == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[at] = value
+            tail_indices[at] = i
+        previous[i] = tail_indices[at - 1] if at > 0 else -1
+
+    result = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+class StackingOrder:
+    """
+    Collects the paint order of a frame from the tag_raise calls made while
+    painting (the last raise of an item wins) and turns it into the fewest
+    raise/lower operations that move the canvas from the previous order to
+    the new one. Items raised through raise_sorted are kept together where
+    the first of them was raised and sorted by their key once per frame.
+
+    stack models the top of the canvas display list (bottom to top): the
+    items stacked by previous frames plus the ones created since, as an
+    insertion ordered dict so creating, deleting and raising an item stay
+    O(1). Items not in it are below all of them. None means the order is
+    unknown, the next frame then raises every item.
+    """
+
+    def __init__(self):
+        self.stack: dict[int, None] | None = {}
+        self.frame: dict[int | str, None] = {}
+        self.groups: dict[str, dict[int, float]] = {}
+        self.grouped: dict[int, str] = {}
+        self.raises: list[int | str] = []
+        self.requests = 0
+
+    def created(self, id: int):
+        if self.stack is not None:
+            self.stack[id] = None
+
+    def deleted(self, ids: Iterable[int]):
+        stack = self.stack if self.stack is not None else {}
+        frame = self.frame
+        for id in ids:
+            stack.pop(id, None)
+            frame.pop(id, None)
+            self.ungroup(id)
+
+    def raised(self, id: int):
+        if self.stack is not None:
+            self.stack.pop(id, None)
+            self.stack[id] = None
+
+    def invalidate(self):
+        self.stack = None
+
+    def ungroup(self, id: int):
+        group = self.grouped.pop(id, None)
+        if group is not None:
+            self.groups[group].pop(id, None)
+
+    def raise_item(self, id: int):
+        self.requests += 1
+        self.raises.append(id)
+        self.ungroup(id)
+        self.frame.pop(id, None)
+        self.frame[id] = None
+
+    def raise_sorted(self, id: int, group: str, key: float):
+        self.requests += 1
+        self.raises.append(group)
+        self.frame.pop(id, None)
+        self.ungroup(id)
+        self.groups.setdefault(group, {})[id] = key
+        self.grouped[id] = group
+        self.frame.setdefault(group, None)
+
+    def mark(self) -> int:
+        return len(self.raises)
+
+    def raised_since(self, mark: int) -> list[int] | None:
+        """
+        The items raised this frame after mark, in the order of their last
+        raise. None when some of them were raised sorted, their place depends
+        on the rest of the group.
+        """
+        raised = self.raises[mark:]
+        if any(isinstance(entry, str) for entry in raised):
+            return None
+        last = list(dict.fromkeys(reversed(raised)))
+        return [id for id in reversed(last) if id in self.frame]  # type: ignore
+
+    def raise_items(self, ids: list[int]):
+        self.requests += len(ids)
+        self.raises.extend(ids)
+        frame = self.frame
+        for id in ids:
+            frame.pop(id, None)
+            frame[id] = None
+
+    def desired(self) -> list[int]:
+        order = []
+        for entry in self.frame:
+            if isinstance(entry, int):
+                order.append(entry)
+                continue
+            items = self.groups.get(entry, {})
+            order.extend(sorted(items, key=items.__getitem__))
+        return order
+
+    def resolve(self) -> list[StackOp]:
+        desired = self.desired()
+        self.raises = []
+        self.frame = {}
+        self.groups = {}
+        self.grouped = {}
+        self.requests = 0
+
+        if len(desired) == 0:
+            return []
+
+        stack = self.stack
+        if stack is None:
+            self.stack = dict.fromkeys(desired)
+            return [("tag_raise", (id,)) for id in desired]
+
+        top = list(islice(reversed(stack), len(desired)))
+        top.reverse()
+        if top == desired:
+            return []
+
+        position = {id: i for i, id in enumerate(stack)}
+        present = [id for id in desired if id in position]
+        kept = {
+            present[i] for i in longest_increasing([position[id] for id in present])
+        }
+
+        wanted = set(desired)
+        first_kept = next((id for id in desired if id in kept), None)
+        ops: list[StackOp] = []
+        for i, id in enumerate(desired):
+            if id in kept:
+                continue
+            if i > 0:
+                ops.append(("tag_raise", (id, desired[i - 1])))
+            elif first_kept is not None:
+                ops.append(("tag_lower", (id, first_kept)))
+            else:
+                ops.append(("tag_raise", (id,)))
+
+        # The bottom of the new order now sits right below the first kept
+        # item, everything above it that is not part of the new order is
+        # lowered below it, keeping the previous order of those items.
+        if first_kept is not None:
+            bottom = desired[0]
+            above = False
+            for id in stack:
+                if id == first_kept:
+                    above = True
+                elif above and id not in wanted:
+                    ops.append(("tag_lower", (id, bottom)))
+
+        self.stack = {id: None for id in stack if id not in wanted}
+        self.stack.update(dict.fromkeys(desired))
+        return ops
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from tkinter import Canvas
+from tkinter.font import Font
+
+from engine.metrics import metrics
+
+
+class TextMetricsCache:
+    """
+    Text widths keyed by (text, font) and heights keyed by (text, font, wrap
+    width, justify). Heights are measured once through the bbox of a scratch
+    text item that is never hidden (hidden items have no bbox), every later
+    lookup is answered without touching Tk. Both caches keep the most
+    recently used entries only.
+    """
+
+    def __init__(self, size: int = 2048):
+        self.size = size
+        self.canvas: Canvas | None = None
+        self.scratch = 0
+        self.widths: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self.heights: OrderedDict[tuple[str, str, float, str], float] = OrderedDict()
+
+    def width(self, font: Font, text: str) -> float:
+        key = (text, str(font))
+        width = self.widths.get(key)
+        if width is not None:
+            metrics.text_cache_hits += 1
+            self.widths.move_to_end(key)
+            return width
+
+        metrics.text_cache_misses += 1
+        width = font.measure(text)
+        self.widths[key] = width
+        if len(self.widths) > self.size:
+            self.widths.popitem(last=False)
+        return width
+
+    def height(
+        self,
+        canvas: Canvas,
+        *,
+        text: str,
+        font: Font,
+        width: float,
+        justify: str,
+    ) -> float | None:
+        key = (text, str(font), width, justify)
+        height = self.heights.get(key)
+        if height is not None:
+            metrics.text_cache_hits += 1
+            self.heights.move_to_end(key)
+            return height
+
+        metrics.text_cache_misses += 1
+        if canvas is not self.canvas:
+            self.canvas = canvas
+            self.scratch = canvas.create_text(0, 0, text="", anchor="nw", fill="")
+        canvas.itemconfigure(
+            self.scratch, text=text, font=font, width=width, justify=justify
+        )
+        bbox = canvas.bbox(self.scratch)
+        if bbox is None:
+            return None
+
+        height = bbox[3] - bbox[1]
+        self.heights[key] = height
+        if len(self.heights) > self.size:
+            self.heights.popitem(last=False)
+        return height
+
+    def clear(self):
+        self.widths.clear()
+        self.heights.clear()
+
+
+text_metrics = TextMetricsCache()
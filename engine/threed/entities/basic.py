@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import copy
+import math
 from abc import ABC, abstractmethod
 from tkinter import Canvas
 from typing import Any, Callable
 
 from engine.threed.models import Position3d, Quaternion, Camera, Size3d
 from engine.models import FrameContext
+from engine.entities.state import overlay_state
 from engine.threed.entities.components.base import Component3d
 
 
@@ -43,6 +45,8 @@ class Entity3d(ABC):
 
 
 class CubeState:
+    __slots__ = ("position", "rotation", "size")
+
     def __init__(self, position: Position3d, rotation: Quaternion, size: Size3d):
         self.position = position
         self.rotation = rotation
@@ -85,7 +89,7 @@ class BaseCube(Entity3d):
         position: Position3d,
         rotation: Quaternion,
     ):
-        state = self.state.copy()
+        state = overlay_state(self.state, self.components)
         for component in self.components:
             component.before_paint(
                 self, ctx, camera, position, rotation, state.size, state
@@ -270,6 +274,7 @@ class Dice(BaseCube):
         self.current_idx = 0
         self.last_raise_idx = 0
         self.ids = []
+        self.hidden: set[int] = set()
 
     def create(self, canvas: Canvas):
         self.canvas = canvas
@@ -292,6 +297,7 @@ class Dice(BaseCube):
             self.canvas.delete(id)
 
         self.ids = []
+        self.hidden = set()
 
     def paint(
         self,
@@ -334,6 +340,27 @@ class Dice(BaseCube):
             self.canvas.tag_raise(self.ids[idx])
         self.last_raise_idx = self.current_idx
 
+    def set_hidden(self, id: int, hidden: bool):
+        if hidden == (id in self.hidden):
+            return
+        if hidden:
+            self.hidden.add(id)
+        else:
+            self.hidden.discard(id)
+        self.canvas.itemconfigure(id, state="hidden" if hidden else "normal")
+
+    def place(self, id: int, vertices: list[float]):
+        # Vertices behind the camera are projected to inf.
+        finite = all(math.isfinite(v) for v in vertices)
+        self.set_hidden(id, not finite)
+        if finite:
+            self.canvas.coords(id, *vertices)
+
+    def skip_face(self, count: int):
+        for _ in range(count):
+            self.set_hidden(self.next_id(), True)
+        self.last_raise_idx = self.current_idx
+
     def front(
         self,
         ctx: FrameContext,
@@ -342,16 +369,15 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
+        if not visible:
+            return self.skip_face(2)
+
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         id = self.next_id()
-        self.canvas.coords(id, *self.side_vertices(w, h, transform))
-        id = self.next_id()
-        self.canvas.coords(id, *self.point(w, h, 0, 0, transform))
+        self.place(id, self.point(w, h, 0, 0, transform))
         self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
 
     def back(
         self,
@@ -361,19 +387,17 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
-        self.canvas.coords(self.next_id(), *self.side_vertices(w, h, transform))
+        if not visible:
+            return self.skip_face(7)
+
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         for x in [-1, 1]:
             for i in range(3):
                 id = self.next_id()
-                self.canvas.coords(
-                    id, *self.point(w, h, x * 0.2, -0.3 + 0.3 * i, transform)
-                )
+                self.place(id, self.point(w, h, x * 0.2, -0.3 + 0.3 * i, transform))
                 self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
 
     def left(
         self,
@@ -383,18 +407,16 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
-        id = self.next_id()
-        self.canvas.coords(id, *self.side_vertices(w, h, transform))
+        if not visible:
+            return self.skip_face(3)
 
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         for y in [-1, 1]:
             id = self.next_id()
-            self.canvas.coords(id, *self.point(w, h, 0, y * 0.2, transform))
+            self.place(id, self.point(w, h, 0, y * 0.2, transform))
             self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
 
     def right(
         self,
@@ -404,23 +426,21 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
-        id = self.next_id()
-        self.canvas.coords(id, *self.side_vertices(w, h, transform))
+        if not visible:
+            return self.skip_face(6)
 
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         for y in [-1, 1]:
             for x in [-1, 1]:
                 id = self.next_id()
-                self.canvas.coords(id, *self.point(w, h, x * 0.22, y * 0.22, transform))
+                self.place(id, self.point(w, h, x * 0.22, y * 0.22, transform))
                 self.canvas.itemconfig(id, fill="black")
 
         id = self.next_id()
-        self.canvas.coords(id, *self.point(w, h, 0, 0, transform))
+        self.place(id, self.point(w, h, 0, 0, transform))
         self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
 
     def top(
         self,
@@ -430,18 +450,16 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
-        id = self.next_id()
-        self.canvas.coords(id, *self.side_vertices(w, h, transform))
+        if not visible:
+            return self.skip_face(4)
 
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         for x in [-1, 0, 1]:
             id = self.next_id()
-            self.canvas.coords(id, *self.point(w, h, x * 0.3, 0, transform))
+            self.place(id, self.point(w, h, x * 0.3, 0, transform))
             self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
 
     def bottom(
         self,
@@ -451,16 +469,14 @@ class Dice(BaseCube):
         transform: TransformFn,
         visible: bool,
     ):
-        id = self.next_id()
-        self.canvas.coords(id, *self.side_vertices(w, h, transform))
+        if not visible:
+            return self.skip_face(5)
 
+        self.place(self.next_id(), self.side_vertices(w, h, transform))
         for y in [-1, 1]:
             for x in [-1, 1]:
                 id = self.next_id()
-                self.canvas.coords(id, *self.point(w, h, x * 0.20, y * 0.20, transform))
+                self.place(id, self.point(w, h, x * 0.20, y * 0.20, transform))
                 self.canvas.itemconfig(id, fill="black")
 
-        if visible:
-            self.raise_last()
-        else:
-            self.last_raise_idx = self.current_idx
+        self.raise_last()
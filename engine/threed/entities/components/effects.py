@@ -6,6 +6,7 @@ from engine.entities.components.effects import Easing
 from engine.threed.entities.basic import Entity3d
 from engine.threed.entities.components.base import Component3d
 from engine.threed.models import Position3d, Quaternion, Size3d
+from engine.scheduler import scheduler
 
 
 class Object3dTransition(Component3d, ABC):
@@ -90,6 +91,8 @@ class Object3dTransition(Component3d, ABC):
             raise Exception("Either speed or duration must be set")
 
         self.progress = min(self.progress, 1)
+        if self.progress < 1:
+            scheduler.invalidate()
 
         self.value = self.last_value.interpolate(
             self.target_value, self.easing(self.progress)
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 
 
 class Transitionable[T](ABC):
+    __slots__ = ()
+
     @abstractmethod
     def distance(self, other: T) -> float:
         pass
@@ -1,5 +1,5 @@
 from typing import Callable
-from engine.entities.basic import Entity, RootScene
+from engine.entities.basic import Entity, Layer, RootScene
 from engine.entities.conditional import EntitySwitch
 from engine.entities.layout import (
     ScreenSizeLayout,
@@ -29,10 +29,11 @@ scene = RootScene(
     children=[
         ScreenSizeLayout(
             child=EntitySwitch(
-                current=lambda: State.scene,
+                current=State.scene,
                 entities=scenes,
+                group=True,
             ),
         ),
-        *([Metrics.build()] if State.metrics else []),
-    ]
+    ],
+    layers=[Layer(children=[Metrics.build()], rate=5)] if State.metrics else [],
 )
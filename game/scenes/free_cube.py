@@ -1,6 +1,6 @@
 import math
 from typing import Any
-from timeit import default_timer as timer
+from engine.clock import clock
 
 from engine.threed.entities.components.effects import SetCursor
 from engine.threed.entities.components.base import Component3d
@@ -25,7 +25,7 @@ class Throwable(Component3d):
         self.drag_start = Position3d(x=0, y=0, z=0)
         self.camera = None
         self.speed = initial_speed
-        self.last_move = timer()
+        self.last_move = clock.now()
 
     def create(self, entity):
         self.entity = entity
@@ -139,7 +139,7 @@ class Throwable(Component3d):
         self.drag_start = self.camera.screen_to_world(
             e.x, e.y, self.entity.state.position.z
         )
-        self.last_move = timer()
+        self.last_move = clock.now()
 
     def drag(self, e):
         if self.camera is None:
@@ -148,7 +148,7 @@ class Throwable(Component3d):
         world_pos = self.camera.screen_to_world(e.x, e.y, self.entity.state.position.z)
 
         if self.dragging:
-            now = timer()
+            now = clock.now()
             delta = now - self.last_move
 
             self.speed = Position3d(
@@ -1,16 +1,12 @@
 from multiprocessing import Pool, Process
 import random
-from tkinter import Canvas
-from tkinter.font import Font
+from engine import fonts
 from typing import Any
 from engine.animation.utils import Easing
 from engine.entities.basic import AnimatedSprite, Entity, PureRect, Rect, Text
 from engine.entities.components.base import (
     Bind,
     Component,
-    Hook,
-    LeaveOriginal,
-    PaintBind,
     PositionGroup,
 )
 from engine.entities.components.events import (
@@ -23,175 +19,126 @@ from engine.entities.components.effects import (
     FillTransition,
     PositionTransition,
     SetCursor,
-    StartOnFill,
     StartOnTop,
 )
 from engine.entities.components.layout import Translate
 from engine.entities.conditional import EntitySwitch, Reactive
+from engine.entities.instanced import Instances
 from engine.entities.layout import (
     Alignment,
     Center,
     Expanded,
     Flex,
     FlexDirection,
+    Grid,
+    GridCell,
     Padding,
     Scene,
     SizeBox,
     Stack,
 )
 from engine.models import Color, Constraints, EdgeInset, FrameContext, Position, Size
-from engine.state import SimpleState
+from engine.scheduler import scheduler
 from game.scenes.dice import GameDice
 from game.state import PlayerState, RoomState, State
 from game.theme_colors import ThemeColors
 from game.widgets.button import Button
 
 
-class GameRoomLines(Entity):
-    tag: str
-
-    def __init__(self, *, tag: str | None = None, room: RoomState):
-        super().__init__(tag=tag)
-        self.room = room
-        self.line_ids = []
-        self._size = Size(
-            width=self.room.width * State.game.scale,
-            height=self.room.height * State.game.scale,
+class GameRoomLines:
+    @staticmethod
+    def build(room: RoomState) -> Entity:
+        scale = State.game.scale
+        columns = [i * scale for i in range(1, room.width)]
+        rows = [i * scale for i in range(1, room.height)]
+        return Instances(
+            shape="line",
+            palette=[ThemeColors.bg()],
+            x=[*columns, *[0] * len(rows)],
+            y=[*[0] * len(columns), *rows],
+            width=[*[0] * len(columns), *[room.width * scale] * len(rows)],
+            height=[*[room.height * scale] * len(columns), *[0] * len(rows)],
+            fill=[0] * (len(columns) + len(rows)),
         )
 
-    def create(self, canvas: Canvas):
-        self.canvas = canvas
-        for _ in range(self.room.width + self.room.height - 2):
-            id = canvas.create_line(
-                0, 0, 0, 0, tags=[self.tag], fill=ThemeColors.bg().to_hex()
-            )
-            self.line_ids.append(id)
-
-    def destroy(self):
-        for id in self.line_ids:
-            self.canvas.delete(id)
-
-    def paint(self, ctx: FrameContext, position: Position):
-        pos = position
-
-        for i in range(self.room.width - 1):
-            x = pos.x + (i + 1) * State.game.scale
-            y = pos.y
-            self.canvas.tag_raise(self.line_ids[i])
-            self.canvas.coords(
-                self.line_ids[i], x, y, x, y + self.room.height * State.game.scale
-            )
-
-        for i in range(self.room.height - 1):
-            x = pos.x
-            y = pos.y + (i + 1) * State.game.scale
-            self.canvas.tag_raise(self.line_ids[self.room.width - 1 + i])
-            self.canvas.coords(
-                self.line_ids[self.room.width - 1 + i],
-                x,
-                y,
-                x + self.room.width * State.game.scale,
-                y,
-            )
-
-    def layout(self, ctx: FrameContext, constraints: Constraints) -> Size:
-        for c in self.components:
-            c.before_layout(self, ctx, None)
-
-        return self._size
-
 
 class GameRoom:
     @staticmethod
-    def build(room: RoomState) -> Entity:
+    def build(room: RoomState) -> GridCell:
         fill = ThemeColors.bg_secondary()
         if room == State.game.start_room:
             fill = ThemeColors.bg_tertiary()
         elif room == State.game.end_room:
             fill = ThemeColors.gold()
 
-        return Stack(
-            components=[
-                Translate(
-                    position=Position(
-                        x=room.x * State.game.scale, y=room.y * State.game.scale
-                    )
-                )
-            ],
-            children=[
-                Rect(
-                    tag="draggable",
-                    fill=fill,
-                    size=Size(
-                        width=room.width * State.game.scale,
-                        height=room.height * State.game.scale,
-                    ),
-                ),
-                GameRoomLines(room=room),
-                # Scene(
-                #     children=[
-                #         *[
-                #             PureRect(
-                #                 tag="draggable",
-                #                 position=Position(y=0, x=(i + 1) * State.game.scale),
-                #                 size=Size(
-                #                     width=1, height=room.height * State.game.scale
-                #                 ),
-                #                 outline_width=0,
-                #                 fill=ThemeColors.bg(),
-                #             )
-                #             for i in range(room.width)
-                #         ],
-                #         *[
-                #             Rect(
-                #                 tag="draggable",
-                #                 components=[
-                #                     Translate(
-                #                         position=Position(
-                #                             x=0, y=(i + 1) * State.game.scale
-                #                         )
-                #                     )
-                #                 ],
-                #                 size=Size(
-                #                     width=room.width * State.game.scale, height=1
-                #                 ),
-                #                 outline_width=0,
-                #                 fill=ThemeColors.bg(),
-                #             )
-                #             for i in range(room.height)
-                #         ],
-                #     ]
-                # ),
-            ],
-        )
-
-
-class GameRoomHalo:
-    @staticmethod
-    def build(room: RoomState, size: float = 10) -> Entity:
-        return SizeBox(
-            width=room.width * State.game.scale + size * 2,
-            height=room.height * State.game.scale + size * 2,
-            components=[
-                Translate(
-                    position=Position(
-                        x=room.x * State.game.scale - size,
-                        y=room.y * State.game.scale - size,
-                    )
-                ),
-            ],
+        return GridCell(
+            x=room.x,
+            y=room.y,
+            width=room.width,
+            height=room.height,
             child=Stack(
                 children=[
                     Rect(
                         tag="draggable",
-                        fill=ThemeColors.muted(),
-                        outline_width=0,
+                        fill=fill,
                         size=Size(
-                            width=room.width * State.game.scale + size * 2,
-                            height=room.height * State.game.scale + size * 2,
+                            width=room.width * State.game.scale,
+                            height=room.height * State.game.scale,
                         ),
-                    )
-                ]
+                    ),
+                    GameRoomLines.build(room),
+                    # Scene(
+                    #     children=[
+                    #         *[
+                    #             PureRect(
+                    #                 tag="draggable",
+                    #                 position=Position(y=0, x=(i + 1) * State.game.scale),
+                    #                 size=Size(
+                    #                     width=1, height=room.height * State.game.scale
+                    #                 ),
+                    #                 outline_width=0,
+                    #                 fill=ThemeColors.bg(),
+                    #             )
+                    #             for i in range(room.width)
+                    #         ],
+                    #         *[
+                    #             Rect(
+                    #                 tag="draggable",
+                    #                 components=[
+                    #                     Translate(
+                    #                         position=Position(
+                    #                             x=0, y=(i + 1) * State.game.scale
+                    #                         )
+                    #                     )
+                    #                 ],
+                    #                 size=Size(
+                    #                     width=room.width * State.game.scale, height=1
+                    #                 ),
+                    #                 outline_width=0,
+                    #                 fill=ThemeColors.bg(),
+                    #             )
+                    #             for i in range(room.height)
+                    #         ],
+                    #     ]
+                    # ),
+                ],
+            ),
+        )
+
+
+class GameRoomHalo:
+    @staticmethod
+    def build(room: RoomState, size: float = 10) -> GridCell:
+        return GridCell(
+            x=room.x,
+            y=room.y,
+            width=room.width,
+            height=room.height,
+            outset=size,
+            child=Rect(
+                tag="draggable",
+                fill=ThemeColors.muted(),
+                outline_width=0,
             ),
         )
 
@@ -230,7 +177,7 @@ class PauseMenu:
                                         Expanded(),
                                         Text(
                                             text=lambda: "Game Paused",
-                                            font=Font(size=24, weight="bold"),
+                                            font=fonts.Font(size=24, weight="bold"),
                                             fill=ThemeColors.fg(),
                                         ),
                                         Expanded(),
@@ -291,7 +238,7 @@ class GameUI:
                                                     padding=EdgeInset(10, 20, 10, 20),
                                                     child=Text(
                                                         text=lambda: State.game.current_player().name,
-                                                        font=Font(
+                                                        font=fonts.Font(
                                                             size=24, weight="bold"
                                                         ),
                                                         fill=ThemeColors.fg_inverse(),
@@ -301,7 +248,7 @@ class GameUI:
                                             Text(
                                                 text=lambda: State.game.current_action_text(),
                                                 fill=ThemeColors.fg(),
-                                                font=Font(size=16, weight="bold"),
+                                                font=fonts.Font(size=16, weight="bold"),
                                             ),
                                         ],
                                     ),
@@ -423,6 +370,8 @@ class RandomWander(Component):
         size: Size,
         state: Any | None,
     ):
+        if self.enabled:
+            scheduler.invalidate()
         if random.random() < 0.1 * ctx.delta_time and self.enabled:
             self.random_offset = self.get_random_position()
 
@@ -455,8 +404,8 @@ class WalkOnPosChange(Component):
 
 
 class YDepthSort(Component):
-    def __init__(self, store: list[tuple[Entity, float]]):
-        self.store = store
+    def __init__(self, group: str):
+        self.group = group
 
     def before_paint(
         self,
@@ -466,24 +415,12 @@ class YDepthSort(Component):
         size: Size,
         state: Any | None,
     ):
-        inserted_at = 0
-        for i, (e, y) in enumerate(self.store):
-            if y > position.y:
-                self.store.insert(i, (entity, position.y))
-                inserted_at = i
-                break
-        else:
-            self.store.append((entity, position.y))
-            inserted_at = len(self.store) - 1
-
-        for i in range(inserted_at + 1, len(self.store)):
-            e, y = self.store[i]
-            e.canvas.tag_raise(e.id)
+        entity.canvas.raise_sorted(entity.id, self.group, position.y)  # type: ignore
 
 
 class GamePlayer:
     @staticmethod
-    def build(p: PlayerState, y_sort_store: list[tuple[Entity, float]]) -> Entity:
+    def build(p: PlayerState, y_sort_group: str) -> Entity:
         player_scale = 1
 
         return AnimatedSprite(
@@ -513,7 +450,7 @@ class GamePlayer:
                         WalkOnPosChange(walk_asset_key=p.character.walk_asset_key),
                     ]
                 ),
-                YDepthSort(y_sort_store),
+                YDepthSort(y_sort_group),
                 OnMouseEnter(callback=lambda *_: State.set_hovered_player(p)),
                 OnMouseLeave(callback=lambda *_: State.set_hovered_player(None)),
                 OnClick(callback=lambda *_: State.toggle_selected_player(p)),
@@ -524,48 +461,12 @@ class GamePlayer:
 
 class AvailableTiles:
     @staticmethod
-    def create_tile(x: int, y: int, distance) -> Entity:
-        hoverred = SimpleState(False)
-        return Rect(
-            fill=Color.from_hex("#565264"),
-            size=Size.square(State.game.scale),
-            components=[
-                Translate(
-                    position=Position(
-                        x=x * State.game.scale,
-                        y=y * State.game.scale,
-                    )
-                ),
-                StartOnFill(
-                    fill=ThemeColors.bg_tertiary()
-                    if State.game.is_in_start_room(x, y)
-                    else ThemeColors.gold()
-                    if State.game.is_in_end_room(x, y)
-                    else ThemeColors.bg_secondary(),
-                    delay=distance * 0.03,
-                ),
-                FillTransition(
-                    duration=0.3,
-                    easing=Easing.ease_in_out,
-                ),
-                OnMouseEnter(callback=lambda *_: hoverred.set(True)),
-                OnMouseLeave(callback=lambda *_: hoverred.set(False)),
-                PaintBind(
-                    "fill",
-                    lambda: ThemeColors.gold() if hoverred.get() else LeaveOriginal(),
-                ),
-                SetCursor(cursor="hand2"),
-                OnClick(callback=lambda *_: State.move_selected_player_to(x, y)),
-            ],
-        )
-
-    @staticmethod
-    def create_tiles() -> list[Entity]:
+    def reachable_tiles() -> list[tuple[int, int, int]]:
         p = State.selected_player
         if p is None:
             return []
 
-        tiles: list[Entity] = []
+        tiles: list[tuple[int, int, int]] = []
 
         queue = [(p.x, p.y)]
         visited = set()
@@ -574,7 +475,7 @@ class AvailableTiles:
         while len(queue) > 0:
             x, y = queue.pop(0)
             dst = distances.get((x, y), 0)
-            tiles.append(AvailableTiles.create_tile(x, y, dst))
+            tiles.append((x, y, dst))
             visited.add((x, y))
 
             if dst == State.game.available_steps:
@@ -596,16 +497,58 @@ class AvailableTiles:
 
         return tiles
 
+    @staticmethod
+    def create_tiles() -> Entity:
+        available, hovered, start_room, room = 0, 1, 2, 3
+
+        def start_fill(x: int, y: int) -> int:
+            if State.game.is_in_start_room(x, y):
+                return start_room
+            if State.game.is_in_end_room(x, y):
+                return hovered
+            return room
+
+        scale = State.game.scale
+        reachable = AvailableTiles.reachable_tiles()
+        tiles = Instances(
+            tag="available_tile",
+            palette=[
+                Color.from_hex("#565264"),
+                ThemeColors.gold(),
+                ThemeColors.bg_tertiary(),
+                ThemeColors.bg_secondary(),
+            ],
+            x=[x * scale for x, _, _ in reachable],
+            y=[y * scale for _, y, _ in reachable],
+            width=[scale] * len(reachable),
+            height=[scale] * len(reachable),
+            fill=[start_fill(x, y) for x, y, _ in reachable],
+            duration=0.3,
+            easing=Easing.ease_in_out,
+            on_enter=lambda _, i: tiles.set_fill(i, hovered, duration=0),
+            on_leave=lambda _, i: tiles.set_fill(i, available, duration=0),
+            on_click=lambda _, i: State.move_selected_player_to(*reachable[i][:2]),
+            components=[SetCursor(cursor="hand2", tag="available_tile")],
+        )
+        for i, (_, _, distance) in enumerate(reachable):
+            tiles.set_fill(i, available, delay=distance * 0.03)
+        return tiles
+
+    @staticmethod
+    def dependency():
+        p = State.selected_player
+        position = None if p is None else (p.x, p.y)
+        return (p, position, State.game.available_steps)
+
     @staticmethod
     def build() -> Entity:
         return Reactive(
-            dependency=lambda: (State.selected_player, State.game.available_steps),
+            dependency=AvailableTiles.dependency,
+            keep_alive=4,
             builder=lambda: EntitySwitch(
                 current=lambda: State.selected_player is not None,
                 entities={
-                    True: lambda: Scene(
-                        children=AvailableTiles.create_tiles(),
-                    ),
+                    True: lambda: AvailableTiles.create_tiles(),
                     False: lambda: Scene(),
                 },
             ),
@@ -637,7 +580,7 @@ class WinnerScreen:
                                 children=[
                                     Expanded(),
                                     Text(
-                                        font=Font(size=24, weight="bold"),
+                                        font=fonts.Font(size=24, weight="bold"),
                                         fill=ThemeColors.fg(),
                                         text=lambda: f"{winner.name} won!",
                                     ),
@@ -665,7 +608,9 @@ class WinnerScreen:
 class Game:
     @staticmethod
     def build() -> Entity:
-        y_sort_store = []
+        halo = 10
+        start_room = State.game.start_room
+        assert start_room is not None
 
         return Stack(
             children=[
@@ -681,37 +626,48 @@ class Game:
                     ],
                 ),
                 Center(
-                    child=Scene(
-                        components=[
-                            Translate(get_position=lambda: State.game_view_offset),
-                        ],
-                        children=[
-                            *[
-                                GameRoomHalo.build(room, 10)
-                                for room in State.game.board
+                    # Centers the start room, whatever the extent of the board.
+                    child=SizeBox(
+                        width=start_room.width * State.game.scale + halo * 2,
+                        height=start_room.height * State.game.scale + halo * 2,
+                        child=Scene(
+                            group=True,
+                            components=[
+                                Translate(get_position=lambda: State.game_view_offset),
                             ],
-                            *[GameRoom.build(room) for room in State.game.board],
-                            AvailableTiles.build(),
-                            *[
-                                GamePlayer.build(p, y_sort_store)
-                                for p in State.shuffled_players()
+                            children=[
+                                Grid(
+                                    cell_size=State.game.scale,
+                                    frozen=True,
+                                    cells=[
+                                        *[
+                                            GameRoomHalo.build(room, halo)
+                                            for room in State.game.board
+                                        ],
+                                        *[
+                                            GameRoom.build(room)
+                                            for room in State.game.board
+                                        ],
+                                    ],
+                                ),
+                                AvailableTiles.build(),
+                                *[
+                                    GamePlayer.build(p, "players")
+                                    for p in State.shuffled_players()
+                                ],
                             ],
-                            Scene(
-                                components=[
-                                    Hook(before_paint=lambda *_: y_sort_store.clear())
-                                ]
-                            ),
-                        ],
+                        ),
                     ),
                 ),
                 GameDice.build(),
                 GameUI.build(),
                 EntitySwitch(
-                    current=lambda: State.game_paused,
+                    current=State.game_paused,
                     entities={
                         True: PauseMenu.build,
                         False: Scene,
                     },
+                    keep_alive=1,
                 ),
                 EntitySwitch(
                     current=lambda: State.game.winner is not None,
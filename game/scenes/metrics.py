@@ -7,7 +7,12 @@ from engine.entities.layout import (
     SizeBox,
 )
 from engine.models import Color, EdgeInset
-from engine.entities.components.debug import FpsCounter, AssetLoaderStats
+from engine.entities.components.debug import (
+    FpsCounter,
+    AssetLoaderStats,
+    FramePhaseStats,
+    FrameTimeStats,
+)
 from game.theme_colors import ThemeColors
 
 
@@ -41,6 +46,16 @@ class Metrics:
                                             ],
                                             text=lambda: "",
                                         ),
+                                        Text(
+                                            fill=ThemeColors.fg(),
+                                            components=[FrameTimeStats()],
+                                            text=lambda: "",
+                                        ),
+                                        Text(
+                                            fill=ThemeColors.fg(),
+                                            components=[FramePhaseStats()],
+                                            text=lambda: "",
+                                        ),
                                     ],
                                 ),
                             ),
@@ -1,6 +1,7 @@
 import copy
-from tkinter.font import Font
-from typing import Callable
+from functools import partial
+from engine import fonts
+from typing import Callable, Hashable
 from engine.entities.basic import AnimatedSprite, Entity, Rect, Text
 from engine.entities.components.base import Hook
 from engine.entities.components.debug import DebugBounds, PrintLifecycle
@@ -14,13 +15,15 @@ from engine.entities.layout import (
     Expanded,
     Flex,
     FlexDirection,
+    Grid,
+    GridCell,
     Padding,
-    Scene,
     SizeBox,
     Stack,
 )
-from engine.models import EdgeInset, Position, Size
-from game.state import PlayerState, State
+from engine.models import Color, EdgeInset, Position, Size
+from engine.signals import Computed
+from game.state import PlayerState, RoomState, State
 from game.theme_colors import ThemeColors
 from game.widgets.button import Button
 
@@ -103,7 +106,7 @@ class PlayerItem:
                         Text(
                             text=lambda: player.name,
                             fill=ThemeColors.fg_inverse(),
-                            font=Font(size=14),
+                            font=fonts.Font(size=14),
                         ),
                         Expanded(),
                         Text(
@@ -118,7 +121,7 @@ class PlayerItem:
                                     )
                                 ),
                             ],
-                            font=Font(weight="bold", size=14, underline=True),
+                            font=fonts.Font(weight="bold", size=14, underline=True),
                             fill=ThemeColors.fg_inverse(),
                         ),
                         Text(
@@ -178,10 +181,11 @@ class ViewPlayers:
                                                 ),
                                                 False: lambda: Text(
                                                     text=lambda: "Character Preview",
-                                                    font=Font(size=18, weight="bold"),
+                                                    font=fonts.Font(size=18, weight="bold"),
                                                     fill=ThemeColors.fg_muted(),
                                                 ),
                                             },
+                                            keep_alive=1,
                                         ),
                                     ),
                                 ),
@@ -212,6 +216,29 @@ class ViewPlayers:
 
 
 class BoardPreview:
+    @staticmethod
+    def room_cell(room: RoomState, fill: Color) -> GridCell:
+        return GridCell(
+            x=room.x,
+            y=room.y,
+            width=room.width,
+            height=room.height,
+            child=Rect(fill=fill),
+        )
+
+    @staticmethod
+    def rooms() -> dict[Hashable, Callable[[], GridCell]]:
+        cells: dict[Hashable, Callable[[], GridCell]] = {}
+        for room in State.game.board:
+            fill = ThemeColors.fg()
+            if room == State.game.start_room:
+                fill = ThemeColors.muted()
+            elif room == State.game.end_room:
+                fill = ThemeColors.gold()
+            key = (room.x, room.y, room.width, room.height, fill.to_hex())
+            cells[key] = partial(BoardPreview.room_cell, room, fill)
+        return cells
+
     @staticmethod
     def build():
         return SizeBox(
@@ -223,24 +250,11 @@ class BoardPreview:
                     State.game.start_room,
                     State.game.end_room,
                 ),
-                builder=lambda: Scene(
-                    children=[
-                        Rect(
-                            fill=ThemeColors.muted()
-                            if room == State.game.start_room
-                            else ThemeColors.gold()
-                            if room == State.game.end_room
-                            else ThemeColors.fg(),
-                            size=Size(width=room.width * 5, height=room.height * 5),
-                            components=[
-                                Translate(
-                                    position=Position(x=room.x * 5, y=room.y * 5 + 100)
-                                ),
-                            ],
-                        )
-                        for room in State.game.board
-                    ],
+                builder=lambda: Grid(
+                    cell_size=5,
+                    components=[Translate(position=Position(x=0, y=100))],
                 ),
+                keyed=BoardPreview.rooms,
             ),
         )
 
@@ -319,22 +333,24 @@ class NewGame:
                                     Text(
                                         text=lambda: "New Game",
                                         fill=ThemeColors.fg(),
-                                        font=Font(size=18, weight="bold"),
+                                        font=fonts.Font(size=18, weight="bold"),
                                     ),
                                     SizeBox(
                                         width=450,
                                         child=Text(
-                                            text=lambda: NewGame.section_titles[
-                                                State.new_game_section
-                                            ],
+                                            text=Computed(
+                                                lambda: NewGame.section_titles[
+                                                    State.new_game_section()
+                                                ]
+                                            ),
                                             fill=ThemeColors.fg(),
-                                            font=Font(size=14),
+                                            font=fonts.Font(size=14),
                                         ),
                                     ),
                                 ],
                             ),
                             EntitySwitch(
-                                current=lambda: State.new_game_section,
+                                current=State.new_game_section,
                                 entities=NewGame.section_map,
                             ),
                         ],
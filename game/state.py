@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import random
 from typing import Literal
 from engine.models import Position
+from engine.signals import Signal
 from game.logger import logger
 
 from game.board_generator import BoardGenerator
@@ -128,25 +129,25 @@ class GameState:
 class State:
     log = logger.getChild("State")
     Scene = Literal["menu", "new_game", "game", "view_board"]
-    scene: str = "menu"
+    scene: Signal[State.Scene] = Signal("menu")
 
     @staticmethod
     def set_scene(scene: State.Scene):
         State.log.info("Scene: %s", scene)
         if scene == "new_game":
             State.game = GameState()
-            State.new_game_section = "choose_n_players"
-            State.game_paused = False
+            State.new_game_section.set("choose_n_players")
+            State.game_paused.set(False)
             State.shown_player = None
-        State.scene = scene
+        State.scene.set(scene)
 
     NewGameSection = Literal["choose_n_players", "view_characters", "view_board"]
-    new_game_section: State.NewGameSection = "choose_n_players"
+    new_game_section: Signal[State.NewGameSection] = Signal("choose_n_players")
 
     @staticmethod
     def set_new_game_section(section: State.NewGameSection):
         State.log.info("New game section: %s", section)
-        State.new_game_section = section
+        State.new_game_section.set(section)
 
     shown_player: PlayerState | None = None
 
@@ -193,12 +194,12 @@ class State:
     def move_game_view(dx: int, dy: int):
         State.game_view_offset.mut_add((dx, dy))
 
-    game_paused = False
+    game_paused = Signal(False)
 
     @staticmethod
     def toggle_game_paused():
         State.log.info("Toggle game paused")
-        State.game_paused = not State.game_paused
+        State.game_paused.set(not State.game_paused())
 
     hovered_player: PlayerState | None = None
 
@@ -2,6 +2,7 @@ import random
 
 from collections.abc import Callable
 from tkinter.font import Font
+from engine import fonts
 from typing import Literal
 from engine.animation.utils import Easing
 from engine.entities.basic import Entity, Rect, Text
@@ -76,7 +77,7 @@ class Button:
                         text=lambda: title,
                         fill=ThemeColors.fg(),
                         font=font
-                        or Font(
+                        or fonts.Font(
                             family="Arial",
                             size=font_size,
                             weight="bold",
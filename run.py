@@ -11,8 +11,11 @@ if sys.version_info < (3, 12):
 import os
 import gc
 import logging
+import random
 from PIL.Image import Resampling
 from engine.renderer import Renderer
+from engine.metrics import frame_times
+from engine.recording import Replayer, recorder
 from engine.assets import Asset, AssetManager, AssetType, TiledAnimation
 from game.theme_colors import ThemeColors
 
@@ -42,6 +45,10 @@ class Program:
 
     def __init__(self):
         options = CliOptions(sys.argv)
+        replayer = Replayer(options.replay) if options.replay else None
+        if replayer is not None:
+            options.metrics = replayer.options.get("metrics", options.metrics)
+
         logging.basicConfig(level=options.global_log_level)
         logging.getLogger("Engine").setLevel(options.engine_log_level)
         logging.getLogger("Game").setLevel(options.log_level)
@@ -49,6 +56,15 @@ class Program:
         if options.metrics:
             gc.set_debug(gc.DEBUG_STATS)
 
+        if replayer is not None:
+            random.seed(replayer.seed)
+        elif options.record:
+            seed = random.randrange(2**32)
+            random.seed(seed)
+            recorder.start(
+                options.record, seed=seed, options={"metrics": options.metrics}
+            )
+
         asset_folder = os.path.join(os.path.dirname(__file__), "game/assets")
         renderer = Renderer(
             options.width,
@@ -56,6 +72,10 @@ class Program:
             asset_folder,
             ThemeColors.bg(),
             options.metrics,
+            headless=options.headless or options.headless_frames > 0,
+            fps_cap=options.fps_cap,
+            idle_redraw=options.idle_redraw,
+            idle_poll=options.idle_poll or None,
         )
 
         from game.game import scene
@@ -69,8 +89,23 @@ class Program:
             self.register_character(renderer.asset_manager, idx, i + 1)
 
         renderer.asset_manager.start()
+        if replayer is not None or options.record:
+            # Frames must not depend on how far the loader thread got.
+            renderer.asset_manager.thread.join()
 
-        renderer.start()
+        try:
+            if replayer is not None:
+                frame_times.resize(len(replayer.frames))
+                renderer.replay(replayer, paced=options.replay_paced)
+                print(
+                    f"Replayed {len(replayer.frames)} frames: {frame_times.summary()}"
+                )
+            elif options.headless_frames > 0:
+                renderer.run(options.headless_frames)
+            else:
+                renderer.start()
+        finally:
+            recorder.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+import logging
+import unittest
+
+from engine.clock import clock
+from engine.entities.basic import RootScene, Text
+from engine.entities.components.base import Bind
+from engine.headless import HeadlessCanvas
+from engine.renderer import Renderer
+from engine.signals import Signal
+from game.theme_colors import ThemeColors
+
+
+class RuntimeLayoutComponents(unittest.TestCase):
+    """
+    Adds and removes a layout component on an entity that is already laid
+    out and checks that its size follows.
+    """
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.renderer = Renderer(
+            800, 600, "game/assets", ThemeColors.bg(), headless=True
+        )
+        assert isinstance(self.renderer.backend, HeadlessCanvas)
+        self.backend = self.renderer.backend
+        self.time = 1000.0
+
+        self.entity = Text(text=Signal("short"))
+        self.renderer.assign_scene(RootScene(children=[self.entity]))
+        self.run_frames(3)
+
+    def tearDown(self):
+        clock.fixed = None
+        logging.disable(logging.NOTSET)
+
+    def run_frames(self, n: int):
+        for _ in range(n):
+            self.time += 1 / 60
+            clock.fixed = self.time
+            self.backend.run_idle_tasks()
+            self.renderer.render(1 / 60)
+
+    def test_append_and_remove(self):
+        short = self.entity._size.width
+        self.assertFalse(self.entity._layout_dirty)
+
+        bind = Bind("text", lambda: "a considerably longer text")
+        self.entity.components.append(bind)
+        self.run_frames(2)
+        longer = self.entity._size.width
+        self.assertGreater(longer, short)
+        self.assertIn(self.entity, self.renderer.scene.layers[0].watched)
+
+        self.entity.components.remove(bind)
+        self.run_frames(2)
+        self.assertEqual(self.entity._size.width, short)
+        self.assertNotIn(self.entity, self.renderer.scene.layers[0].watched)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import logging
+import random
+import unittest
+
+from engine.clock import clock
+from engine.entities.basic import Rect
+from engine.entities.layout import Grid, Stack
+from engine.headless import HeadlessCanvas
+from engine.renderer import Renderer
+from game.state import State
+from game.theme_colors import ThemeColors
+
+
+class FrozenBoardCulling(unittest.TestCase):
+    """
+    Pans the frozen game board across the canvas and checks that every room
+    and halo rect is hidden exactly when it lies outside the canvas.
+    """
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        random.seed(3)
+        from game.game import scene
+
+        self.renderer = Renderer(
+            1280, 800, "game/assets", ThemeColors.bg(), headless=True
+        )
+        self.renderer.assign_scene(scene)
+        assert isinstance(self.renderer.backend, HeadlessCanvas)
+        self.backend = self.renderer.backend
+        self.time = 1000.0
+
+        State.game.create_players(3)
+        State.game.generate_board()
+        State.set_scene("game")
+        self.run_frames(5)
+
+    def tearDown(self):
+        clock.fixed = None
+        logging.disable(logging.NOTSET)
+
+    def run_frames(self, n: int):
+        for _ in range(n):
+            self.time += 1 / 60
+            clock.fixed = self.time
+            self.backend.run_idle_tasks()
+            self.renderer.render(1 / 60)
+
+    def board(self) -> Grid:
+        assert self.renderer.scene is not None
+        pending = [
+            child for layer in self.renderer.scene.layers for child in layer.children
+        ]
+        while len(pending) > 0:
+            entity = pending.pop()
+            if isinstance(entity, Grid) and entity._frozen_order is not None:
+                return entity
+            pending.extend(child for child, _, _ in entity.paint_children())
+        raise Exception("No frozen board found")
+
+    def assert_culled(self):
+        board = self.board()
+        origin_x, origin_y, _, _ = self.renderer.canvas.placed[board.group]  # type: ignore
+        for cell, (x, y) in zip(board.cells, board.offsets):
+            child = cell.child
+            rect = child.children[0] if isinstance(child, Stack) else child
+            assert isinstance(rect, Rect)
+            left = origin_x + x
+            top = origin_y + y
+            outside = (
+                left > self.renderer.width
+                or top > self.renderer.height
+                or left + child._size.width < 0
+                or top + child._size.height < 0
+            )
+            state = self.backend.items[rect.id].options.get("state", "normal")
+            self.assertEqual(state == "hidden", outside, (left, top))
+
+    def test_pan(self):
+        self.assert_culled()
+        for dx, dy in [(-1500, 0), (1500, 0), (-700, 0), (0, -450), (2000, 900)]:
+            State.move_game_view(dx, dy)
+            self.run_frames(3)
+            self.assert_culled()
+
+
+if __name__ == "__main__":
+    unittest.main()
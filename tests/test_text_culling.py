@@ -0,0 +1,66 @@
+import logging
+import unittest
+
+from engine.clock import clock
+from engine.entities.basic import RootScene, Text
+from engine.entities.components.base import Hook
+from engine.headless import HeadlessCanvas
+from engine.renderer import Renderer
+from engine.signals import Signal
+from game.theme_colors import ThemeColors
+
+
+class CulledTextLayout(unittest.TestCase):
+    """
+    Changes the text of a Text while it is culled and checks that it has the
+    height of the new text once it is back on the canvas.
+    """
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.renderer = Renderer(
+            800, 600, "game/assets", ThemeColors.bg(), headless=True
+        )
+        assert isinstance(self.renderer.backend, HeadlessCanvas)
+        self.backend = self.renderer.backend
+        self.time = 1000.0
+        self.offset = 0.0
+
+        def shift(entity, ctx, position, size, state):
+            position.x += self.offset
+
+        self.text = Signal("one line")
+        self.entity = Text(text=self.text, components=[Hook(before_paint=shift)])
+        self.renderer.assign_scene(RootScene(children=[self.entity]))
+        self.run_frames(3)
+
+    def tearDown(self):
+        clock.fixed = None
+        logging.disable(logging.NOTSET)
+
+    def run_frames(self, n: int):
+        for _ in range(n):
+            self.time += 1 / 60
+            clock.fixed = self.time
+            self.backend.run_idle_tasks()
+            self.renderer.render(1 / 60)
+
+    def test_text_changed_while_culled(self):
+        one_line = self.entity._size.height
+        self.assertGreater(one_line, 0)
+
+        self.offset = 5000
+        self.run_frames(3)
+        state = self.backend.items[self.entity.id].options.get("state")
+        self.assertEqual(state, "hidden")
+
+        self.text.set("three\nshort\nlines")
+        self.run_frames(3)
+        self.offset = 0
+        self.run_frames(3)
+
+        self.assertEqual(self.entity._size.height, one_line * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()